@@ -3,6 +3,7 @@ This configuration module for pytest defines fixtures that are used across multi
 
 Fixtures:
 ---------
+- `constants`: Provides the immutable table of values behind the string fixtures.
 - `test_message`: Provides a standard test message for use in various tests.
 - `success_prompt`: Provides a standard success prompt for use in various tests.
 - `warning_prompt`: Provides a standard warning prompt for use in various tests.
@@ -14,14 +15,9 @@ Fixtures:
 - `custom_prompt_prefix`: Provides a standard custom prompt prefix for use in various tests.
 - `custom_prompt_suffix`: Provides a standard custom prompt suffix for use in various tests.
 - `custom_color`: Provides a standard test color for use in various tests.
-- `cr_custom_color`: Provides the colorama.Fore.XXX color code for custom color.
-- `cr_red`: Provides the colorama.Fore.RED color code.
-- `cr_yellow`: Provides the colorama.Fore.YELLOW color code.
-- `cr_green`: Provides the colorama.Fore.GREEN color code.
-- `cr_cyan`: Provides the colorama.Fore.CYAN color code.
-- `cr_grey`: Provides the colorama.Fore.LIGHTBLACK_EX color code.
-- `cr_bold`: Provides the colorama.Style.BRIGHT color code.
-- `cr_reset`: Provides the colorama.Style.RESET_ALL color code.
+- `installed_version`: Provides the installed package version, or None if it is not installed.
+- `expected_default_messages`: Provides the fully formatted default output of each message function.
+- `expected_custom_color_prefixes`: Provides the expected start of each message with the custom color, per scope.
 - `custom_color_bold`: Provides a standard test color with bold style for use in various tests.
 - `default_scope`: Provides a default scope for use in various tests.
 - `whole_message`: Provides a 'whole message' scope for use in various tests.
@@ -29,7 +25,8 @@ Fixtures:
 - `inside_brackets`: Provides a 'inside brackets' scope for use in various tests.
 
 These fixtures are defined with a session scope, meaning they are initialized once per test session
-and can be used by any test function within that session.
+and can be used by any test function within that session. The ANSI escape codes themselves are plain
+constants in `tests/notify_ansi.py`, so they are imported directly rather than served by a fixture.
 
 Example Usage:
 --------------
@@ -41,315 +38,170 @@ To use these fixtures in your test functions, simply add them as parameters to y
 This ensures that the same test message and prompts are used consistently across all tests.
 """
 
-from typing import Literal
-import pytest
-import colorama
-
-
-@pytest.fixture(scope="session")
-def test_message() -> Literal['This is a message']:
-    """
-    Provide a standard test message.
-
-    This fixture returns a string that can be used as a standard test message
-    across multiple tests.
-
-    Returns:
-        str: A standard test message.
-    """
-    return "This is a message"
-
-
-@pytest.fixture(scope="session")
-def success_prompt() -> Literal['Success']:
-    """
-    Provide a standard success prompt.
-
-    This fixture returns a string that can be used as a standard success prompt
-    across multiple tests.
+import importlib.metadata
+import sys
 
-    Returns:
-        str: A standard success prompt.
-    """
-    return "Success"
-
-
-@pytest.fixture(scope="session")
-def warning_prompt() -> Literal['Warning']:
-    """
-    Provide a standard warning prompt.
-
-    This fixture returns a string that can be used as a standard warning prompt
-    across multiple tests.
+from types import MappingProxyType
+from typing import Callable, Optional
+import pytest
 
-    Returns:
-        str: A standard warning prompt.
-    """
-    return "Warning"
+from notify_ansi import CR_CUSTOM, CR_RED, CR_YELLOW, CR_GREEN, CR_CYAN, CR_GREY, CR_BOLD, CR_RESET
 
 
-@pytest.fixture(scope="session")
-def error_prompt() -> Literal['Error']:
-    """
-    Provide a standard error prompt.
+# The plain string fixtures, keyed by fixture name. Each entry is turned into a
+# session-scoped fixture by `_make_constant_fixture` below.
+_CONSTANTS: dict[str, str] = {
+    "test_message": "This is a message",
+    "success_prompt": "Success",
+    "warning_prompt": "Warning",
+    "error_prompt": "Error",
+    "failure_prompt": "Failure",
+    "info_prompt": "Info",
+    "system_prompt": "System",
+    "custom_prompt": "Custom",
+    "custom_prompt_prefix": "{ ",
+    "custom_prompt_suffix": " }",
+    "custom_color": "blue",
+    "default_scope": "prompt_text",
+    "whole_message": "all",
+    "whole_prompt": "prompt"
+}
 
-    This fixture returns a string that can be used as a standard error prompt
-    across multiple tests.
 
-    Returns:
-        str: A standard error prompt.
-    """
-    return "Error"
+# The message levels, each with the ANSI code of its default color and the constants key of its default prompt.
+_LEVELS: dict[str, tuple[str, str]] = {
+    "success": (CR_GREEN, "success_prompt"),
+    "warning": (CR_YELLOW, "warning_prompt"),
+    "error": (CR_RED, "error_prompt"),
+    "failure": (CR_RED, "failure_prompt"),
+    "info": (CR_CYAN, "info_prompt"),
+    "system": (CR_GREY, "system_prompt")
+}
 
 
 @pytest.fixture(scope="session")
-def failure_prompt() -> Literal['Failure']:
+def constants() -> MappingProxyType:
     """
-    Provide a standard failure prompt.
+    Provide the shared, read-only table of test constants.
 
-    This fixture returns a string that can be used as a standard failure prompt
-    across multiple tests.
+    Every string fixture is a thin wrapper around this mapping, so pytest resolves
+    the table once per session and each wrapper is a single dict lookup. The values
+    are interned so every test receives the very same string objects.
 
     Returns:
-        str: A standard error prompt.
+        MappingProxyType: An immutable mapping of fixture name to value.
     """
-    return "Failure"
+    return MappingProxyType({name: sys.intern(value) for name, value in _CONSTANTS.items()})
 
 
-@pytest.fixture(scope="session")
-def info_prompt() -> Literal['Info']:
+def _make_constant_fixture(name: str) -> Callable:
     """
-    Provide a standard info prompt.
+    Build a session-scoped fixture that returns a single entry from the constants table.
 
-    This fixture returns a string that can be used as a standard info prompt
-    across multiple tests.
+    Arguments:
+        name (str): The fixture name, which is also the key into the constants table.
 
     Returns:
-        str: A standard info prompt.
+        Callable: The registered pytest fixture.
     """
-    return "Info"
-
+    def _fixture(constants) -> str:  # pylint: disable=redefined-outer-name
+        return constants[name]
 
-@pytest.fixture(scope="session")
-def system_prompt() -> Literal['System']:
-    """
-    Provide a standard system prompt.
+    _fixture.__name__ = name
+    _fixture.__doc__ = f"Provide the '{name}' test constant."
+    return pytest.fixture(scope="session", name=name)(_fixture)
 
-    This fixture returns a string that can be used as a standard system prompt
-    across multiple tests.
 
-    Returns:
-        str: A standard system prompt.
+def _install_fixtures() -> None:
     """
-    return "System"
-
+    Register one fixture per entry in the constants table.
 
-@pytest.fixture(scope="session")
-def custom_prompt() -> Literal['Custom']:
+    This runs once, when pytest imports the conftest. It has to happen at import time rather
+    than in a `pytest_configure` hook, because pytest collects the fixtures from this module's
+    namespace as soon as the conftest is registered.
     """
-    Provide a standard custom prompt.
+    module_globals: dict = globals()
+    for name in _CONSTANTS:
+        module_globals[name] = _make_constant_fixture(name)
 
-    This fixture returns a string that can be used as a standard custom prompt
-    across multiple tests.
 
-    Returns:
-        str: A standard custom prompt.
-    """
-    return "Custom"
+_install_fixtures()
 
 
 @pytest.fixture(scope="session")
-def custom_prompt_prefix() -> Literal['{ ']:
+def installed_version() -> Optional[str]:
     """
-    Provide a standard custom prompt prefix.
+    Provide the installed version of the wolfsoftware.notify package.
 
-    This fixture returns a string that can be used as a standard custom prompt
-    prefix across multiple tests.
+    The distribution metadata is looked up once per session rather than once per test.
 
     Returns:
-        str: A standard custom prompt prefix.
+        Optional[str]: The installed version, or None if the package is not installed.
     """
-    return "{ "
+    try:
+        return importlib.metadata.distribution('wolfsoftware.notify').version
+    except importlib.metadata.PackageNotFoundError:
+        return None
 
 
 @pytest.fixture(scope="session")
-def custom_prompt_suffix() -> Literal[' }']:
+def expected_default_messages(test_message) -> MappingProxyType:
     """
-    Provide a standard custom prompt suffix.
+    Provide the fully formatted output of each message function when called with only the test message.
 
-    This fixture returns a string that can be used as a standard custom prompt
-    suffix across multiple tests.
+    The strings are built once per session so tests can compare the whole result with a single equality check.
 
     Returns:
-        str: A standard custom prompt suffix.
+        MappingProxyType: The expected messages keyed by message level.
     """
-    return " }"
+    return MappingProxyType({
+        level: f"[ {color}{CR_BOLD}{_CONSTANTS[prompt_key]}{CR_RESET} ] {test_message}"
+        for level, (color, prompt_key) in _LEVELS.items()
+    })
 
 
 @pytest.fixture(scope="session")
-def custom_color() -> Literal['blue']:
-    """
-    Provide a standard test color.
-
-    This fixture returns a string that can be used as the default test color
-    across multiple tests.
-
-    Returns:
-        str: The default test color.
-    """
-    return "blue"
-
-
-@pytest.fixture
-def cr_custom_color() -> str:
-    """
-    Provide the colorama.Fore.XXX color code.
-
-    Returns:
-        str: The ANSI escape code for custom color.
-    """
-    return colorama.Fore.BLUE
-
-
-@pytest.fixture
-def cr_red() -> str:
-    """
-    Provide the colorama.Fore.RED color code.
-
-    Returns:
-        str: The ANSI escape code for red text.
-    """
-    return colorama.Fore.RED
-
-
-@pytest.fixture
-def cr_yellow() -> str:
+def expected_custom_color_prefixes() -> MappingProxyType:
     """
-    Provide the colorama.Fore.YELLOW color code.
+    Provide the expected start of each message when the custom color is applied.
 
-    Returns:
-        str: The ANSI escape code for yellow text.
-    """
-    return colorama.Fore.YELLOW
-
-
-@pytest.fixture
-def cr_green() -> str:
-    """
-    Provide the colorama.Fore.GREEN color code.
-
-    Returns:
-        str: The ANSI escape code for green text.
-    """
-    return colorama.Fore.GREEN
-
-
-@pytest.fixture
-def cr_cyan() -> str:
-    """
-    Provide the colorama.Fore.CYAN color code.
-
-    Returns:
-        str: The ANSI escape code for cyan text.
-    """
-    return colorama.Fore.CYAN
-
-
-@pytest.fixture
-def cr_grey() -> str:
-    """
-    Provide the colorama.Fore.LIGHTBLACK_EX (grey) color code.
-
-    Returns:
-        str: The ANSI escape code for grey text.
-    """
-    return colorama.Fore.LIGHTBLACK_EX
-
-
-@pytest.fixture
-def cr_bold() -> str:
-    """
-    Provide the colorama.Style.BRIGHT color code.
-
-    Returns:
-        str: The ANSI escape code for bold color.
-    """
-    return colorama.Style.BRIGHT
-
-
-@pytest.fixture
-def cr_reset() -> str:
-    """
-    Provide the colorama.Style.RESET_ALL color code.
+    The prefixes are built once per session, so tests compare against a ready-made string
+    instead of formatting one on every run.
 
     Returns:
-        str: The ANSI escape code for resetting color.
+        MappingProxyType: The expected prefixes keyed by message level and then by scope.
     """
-    return colorama.Style.RESET_ALL
+    return MappingProxyType({
+        level: MappingProxyType({
+            "all": f"{CR_CUSTOM}[ {_CONSTANTS[prompt_key]} ]",
+            "prompt": f"{CR_CUSTOM}[ {_CONSTANTS[prompt_key]} ]{CR_RESET}",
+            "prompt_text": f"[ {CR_CUSTOM}{_CONSTANTS[prompt_key]}{CR_RESET} ]",
+        })
+        for level, (_, prompt_key) in _LEVELS.items()
+    })
 
 
 @pytest.fixture(scope="session")
-def custom_color_bold() -> Literal['blue+bold']:
+def custom_color_bold(custom_color) -> str:
     """
-    Provide a standard test color.
+    Provide the standard test color with the bold style added.
 
-    This fixture returns a string that can be used as the default test color
-    across multiple tests.
+    This is derived from `custom_color`, so the two can never drift apart.
 
     Returns:
         str: The default test color + bold.
     """
-    return "blue+bold"
-
-
-@pytest.fixture(scope="session")
-def default_scope() -> Literal['prompt_text']:
-    """
-    Provide a default scope.
-
-    This fixture returns a string that can be used as the default scope
-    across multiple tests.
-
-    Returns:
-        str: The default scope.
-    """
-    return "prompt_text"
-
-
-@pytest.fixture(scope="session")
-def whole_message() -> Literal['all']:
-    """
-    Provide a 'all' scope.
-
-    This fixture returns a string that can be used across multiple tests.
-
-    Returns:
-        str: The default scope.
-    """
-    return "all"
-
-
-@pytest.fixture(scope="session")
-def whole_prompt() -> Literal['prompt']:
-    """
-    Provide a 'prompt' scope.
-
-    This fixture returns a string that can be used across multiple tests.
-
-    Returns:
-        str: The default scope.
-    """
-    return "prompt"
+    return f"{custom_color}+bold"
 
 
 @pytest.fixture(scope="session")
-def inside_brackets() -> Literal['prompt_text']:
+def inside_brackets(default_scope) -> str:
     """
     Provide a 'prompt_text' scope.
 
-    This fixture returns a string that can be used across multiple tests.
+    This is an alias of `default_scope`, so both names always share a single cached value.
 
     Returns:
         str: The default scope.
     """
-    return "prompt_text"
+    return default_scope
@@ -0,0 +1,32 @@
+"""
+This module defines the ANSI escape codes that the tests expect to find in formatted messages.
+
+The codes are written out as plain module-level constants rather than served by fixtures, so tests
+can import them once at module scope and pytest does not have to resolve a fixture for each lookup.
+
+Constants:
+----------
+- `CR_CUSTOM`: The code of the custom test color (blue).
+- `CR_RED`: The code of the red foreground color.
+- `CR_YELLOW`: The code of the yellow foreground color.
+- `CR_GREEN`: The code of the green foreground color.
+- `CR_CYAN`: The code of the cyan foreground color.
+- `CR_GREY`: The code of the grey (light black) foreground color.
+- `CR_BOLD`: The code of the bold (bright) style.
+- `CR_RESET`: The code that resets all formatting.
+
+Example Usage:
+--------------
+    from notify_ansi import CR_GREEN, CR_BOLD, CR_RESET
+
+    assert success_message("Done") == f"[ {CR_GREEN}{CR_BOLD}Success{CR_RESET} ] Done"
+"""
+
+CR_CUSTOM: str = "\x1b[34m"
+CR_RED: str = "\x1b[31m"
+CR_YELLOW: str = "\x1b[33m"
+CR_GREEN: str = "\x1b[32m"
+CR_CYAN: str = "\x1b[36m"
+CR_GREY: str = "\x1b[90m"
+CR_BOLD: str = "\x1b[1m"
+CR_RESET: str = "\x1b[0m"
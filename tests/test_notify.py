@@ -12,41 +12,34 @@ The tests ensure that:
 Functions:
 ----------
 - `test_version`: Verifies that a version is defined for the package.
-- `test_success_message_default_color`: Tests the default color of success messages.
-- `test_success_message_custom_color_whole_message`: Tests custom color applied to the whole success message.
-- `test_success_message_custom_color_whole_prompt`: Tests custom color applied to the whole success prompt.
-- `test_success_message_custom_color_inside_brackets`: Tests custom color applied inside the success brackets.
-- `test_custom_prompt_success_message`: Tests custom prompt in success messages.
-- `test_success_message_invalid_color`: Tests success message with an invalid color.
-- `test_warning_message_default_color`: Tests the default color of warning messages.
-- `test_warning_message_custom_color`: Tests custom color applied to the whole warning message.
-- `test_warning_message_custom_color_whole_prompt`: Tests custom color applied to the whole warning prompt.
-- `test_warning_message_custom_color_inside_brackets`: Tests custom color applied inside the warning brackets.
-- `test_custom_prompt_warning_message`: Tests custom prompt in warning messages.
-- `test_warning_message_invalid_color`: Tests warning message with an invalid color.
-- `test_error_message_default_color`: Tests the default color of error messages.
-- `test_error_message_custom_color`: Tests custom color applied to the whole error message.
-- `test_error_message_custom_color_whole_prompt`: Tests custom color applied to the whole error prompt.
-- `test_error_message_custom_color_inside_brackets`: Tests custom color applied inside the error brackets.
-- `test_custom_prompt_error_message`: Tests custom prompt in error messages.
-- `test_error_message_invalid_color`: Tests error message with an invalid color.
-- `test_failure_message`: Tests the alias function for error messages.
-- `test_info_message_default_color`: Tests the default color of info messages.
-- `test_info_message_custom_color`: Tests custom color applied to the whole info message.
-- `test_info_message_custom_color_whole_prompt`: Tests custom color applied to the whole info prompt.
-- `test_info_message_custom_color_inside_brackets`: Tests custom color applied inside the info brackets.
-- `test_custom_prompt_info_message`: Tests custom prompt in info messages.
-- `test_info_message_invalid_color`: Tests info message with an invalid color.
-- `test_system_message_default_color`: Tests the default color of system messages.
-- `test_system_message_custom_color`: Tests custom color applied to the whole system message.
-- `test_system_message_custom_color_whole_prompt`: Tests custom color applied to the whole system prompt.
-- `test_system_message_custom_color_inside_brackets`: Tests custom color applied inside the system brackets.
-- `test_custom_prompt_system_message`: Tests custom prompt in system messages.
-- `test_system_message_invalid_color`: Tests system message with an invalid color.
-- `test_custom_prompt_prefix_suffix`: Tests message functions with custom prompt prefix and suffix.
+
+Each of the following is parametrized over the success, warning, error, failure, info and system message functions:
+
+- `test_default_color`: Tests the default color of the messages.
+- `test_custom_color_scope`: Tests custom color applied to the whole message, the whole prompt and inside the brackets.
+- `test_custom_prompt`: Tests a custom prompt.
+- `test_custom_prompt_prefix_suffix`: Tests a custom prompt prefix and suffix.
+- `test_invalid_color`: Tests the messages with an invalid color.
+- `test_default_bytes`: Tests the bytes variant of the message function with its default style, including an exception message.
+- `test_bytes_match_message`: Tests the bytes variant encodes exactly what the message function returns.
+- `test_positional_arguments`: Tests the color and prompt can be passed positionally.
+- `test_exception_message`: Tests an exception passed as the message is converted with str().
+- `test_non_string_prompt`: Tests a non-string prompt is converted with str().
+
 - `test_get_color_codes_valid`: Tests get_color_codes with valid color format.
 - `test_get_color_codes_invalid_format`: Tests get_color_codes with an invalid format.
 - `test_get_color_codes_invalid_component`: Tests get_color_codes with an invalid color component.
+- `test_get_color_codes_sanitized`: Tests get_color_codes sanitizes case, punctuation and non-ASCII characters.
+- `test_get_color_codes_sanitized_invalid`: Tests get_color_codes reports the sanitized component of an invalid specification.
+- `test_get_color_codes_dict`: Tests the dictionary-returning get_color_codes_dict shim.
+- `test_format_many_color_runs`: Tests format_many emits each color once per run of same-colored messages.
+- `test_format_many_empty`: Tests format_many with no messages.
+- `test_format_many_invalid_level`: Tests format_many with an invalid level.
+- `test_make_style`: Tests a style made with make_style formats messages like the matching message function.
+- `test_make_style_invalid_color`: Tests make_style validates the color when the style is made.
+- `test_notify_value_error_kinds`: Tests NotifyValueError formats a known error kind into its message and arguments.
+- `test_notify_value_error_free_text`: Tests NotifyValueError passes plain messages and unmatched values through like ValueError.
+- `test_notify_value_error_is_value_error`: Tests NotifyValueError can be caught as a ValueError.
 
 Example Usage:
 --------------
@@ -54,19 +47,16 @@ To run these tests, you can use a testing framework such as pytest:
 
     pytest test_notify.py
 
-Each test function asserts that the respective message functions return strings that start with the
-appropriate prefix, ensuring that the message formatting is correct, and handle errors appropriately.
+Each test function asserts that the respective message functions return exactly the expected string,
+ensuring that the message formatting is correct, and handle errors appropriately.
 """
 # pylint: disable=too-many-arguments, too-many-locals, too-few-public-methods
 
-import re
-
-import importlib.metadata
-
-from typing import Optional
+from typing import Callable
 
 import pytest
 
+from notify_ansi import CR_CUSTOM, CR_RED, CR_YELLOW, CR_GREEN, CR_CYAN, CR_GREY, CR_BOLD, CR_RESET
 
 from wolfsoftware.notify import (  # pylint: disable=import-error, no-name-in-module
     success_message,
@@ -75,849 +65,282 @@ from wolfsoftware.notify import (  # pylint: disable=import-error, no-name-in-mo
     failure_message,
     info_message,
     system_message,
+    format_many,
+    make_style,
+    Style,
+    success_bytes,
+    warning_bytes,
+    error_bytes,
+    failure_bytes,
+    info_bytes,
+    system_bytes,
     NotifyValueError,
-    get_color_codes
+    get_color_codes,
+    get_color_codes_dict
 )
 
 
-class TestVersion:
+@pytest.mark.xdist_group(name="notify_tests")
+def test_version(installed_version) -> None:
+    """Test that a version is defined."""
+    assert installed_version is not None, "Version should be set"  # nosec: B101
+    assert installed_version != 'unknown', f"Expected version, but got {installed_version}"  # nosec: B101
+
+
+# Expected error text, checked as a plain substring of the raised exception so no regex has to be compiled or escaped.
+INVALID_COLOR_MESSAGE: str = "Invalid color component 'invalid'"
+INVALID_FORMAT_MESSAGE: str = "Invalid color format. Use 'color', 'color+bold', or 'bold'."
+INVALID_LEVEL_MESSAGE: str = "Invalid level 'invalid'"
+
+# The message functions keyed by message level.
+MESSAGE_FUNCTIONS: dict[str, Callable[..., str]] = {
+    "success": success_message,
+    "warning": warning_message,
+    "error": error_message,
+    "failure": failure_message,
+    "info": info_message,
+    "system": system_message,
+}
+
+# The bytes variants of the message functions keyed by message level.
+BYTES_FUNCTIONS: dict[str, Callable[[str], bytes]] = {
+    "success": success_bytes,
+    "warning": warning_bytes,
+    "error": error_bytes,
+    "failure": failure_bytes,
+    "info": info_bytes,
+    "system": system_bytes,
+}
+
+# The ANSI code of each message level's default color.
+DEFAULT_COLORS: dict[str, str] = {
+    "success": CR_GREEN,
+    "warning": CR_YELLOW,
+    "error": CR_RED,
+    "failure": CR_RED,
+    "info": CR_CYAN,
+    "system": CR_GREY,
+}
+
+# The message levels every TestMessages test is parametrized over.
+MESSAGE_LEVELS: list[str] = list(MESSAGE_FUNCTIONS)
+
+# Each scope with a builder that turns the expected colored prompt, the message and the reset code into the full expected output.
+SCOPE_VARIANTS: list = [
+    ("all", lambda prompt, message, reset: f"{prompt} {message}{reset}"),
+    ("prompt", lambda prompt, message, reset: f"{prompt} {message}"),
+    ("prompt_text", lambda prompt, message, reset: f"{prompt} {message}"),
+]
+SCOPE_VARIANT_IDS: list[str] = ["whole_message", "whole_prompt", "inside_brackets"]
+
+# Color specifications that only resolve once sanitized (case folded, stray punctuation, spaces and non-ASCII removed),
+# each with the canonical spelling it must resolve to.
+SANITIZED_COLORS: list[tuple[str, str]] = [
+    ("Green + BOLD", "green+bold"),
+    ("RED", "red"),
+    (" blue!", "blue"),
+    ("bold+Magenta", "bold+magenta"),
+    ("cyan\u00e9+bold", "cyan+bold"),
+]
+
+# Color specifications that are still invalid once sanitized, each with the component the error must name.
+SANITIZED_INVALID_COLORS: list[tuple[str, str]] = [
+    ("Purple + Bold", "purple"),
+    ("R\u00ebd", "rd"),
+]
+
+
+@pytest.mark.xdist_group(name="notify_tests")
+@pytest.mark.parametrize("level", MESSAGE_LEVELS)
+class TestMessages:
     """
-    Grouped tests for versions.
+    Grouped tests for all of the message functions.
+
+    Every test is parametrized over the message level alone. The function under test is looked up in
+    MESSAGE_FUNCTIONS, and the default prompt and color in the constants fixture and DEFAULT_COLORS.
     """
-    def test_version(self) -> None:
-        """
-        Test that a version is defined.
 
-        This test verifies that the version of the package is defined and not set to 'unknown'.
+    def test_default_color(self, level, test_message, expected_default_messages) -> None:
+        """Test a message function with its default color."""
+        assert MESSAGE_FUNCTIONS[level](message=test_message) == expected_default_messages[level]  # nosec: B101
 
-        Asserts:
-            The version is not None and not 'unknown'.
-        """
-        version: Optional[str] = None
+    @pytest.mark.parametrize("scope, expected_builder", SCOPE_VARIANTS, ids=SCOPE_VARIANT_IDS)
+    def test_custom_color_scope(
+        self,
+        level,
+        scope,
+        expected_builder,
+        test_message,
+        custom_color,
+        expected_custom_color_prefixes
+    ) -> None:
+        """Test a message function with custom color applied to each scope."""
+        result: str = MESSAGE_FUNCTIONS[level](message=test_message, color=custom_color, scope=scope)
 
-        try:
-            version = importlib.metadata.version('wolfsoftware.notify')
-        except importlib.metadata.PackageNotFoundError:
-            version = None
+        assert result == expected_builder(expected_custom_color_prefixes[level][scope], test_message, CR_RESET)  # nosec: B101
 
-        assert version is not None, "Version should be set"  # nosec: B101
-        assert version != 'unknown', f"Expected version, but got {version}"  # nosec: B101
+    def test_custom_prompt(self, level, test_message, custom_prompt, inside_brackets) -> None:
+        """Test a message function with a custom prompt."""
+        result: str = MESSAGE_FUNCTIONS[level](message=test_message, prompt=custom_prompt, scope=inside_brackets)
 
+        assert result == f"[ {DEFAULT_COLORS[level]}{CR_BOLD}{custom_prompt}{CR_RESET} ] {test_message}"  # nosec: B101
 
-class TestSuccessMessages:
-    """
-    Grouped tests for success_message function.
-    """
+    def test_custom_prompt_prefix_suffix(
+        self,
+        level,
+        test_message,
+        custom_prompt_prefix,
+        custom_prompt_suffix,
+        constants
+    ) -> None:
+        """Test a message function with custom prompt prefix and suffix."""
+        prompt: str = constants[f"{level}_prompt"]
+        result: str = MESSAGE_FUNCTIONS[level](test_message, prompt_prefix=custom_prompt_prefix, prompt_suffix=custom_prompt_suffix)
 
-    def test_success_message_default_color(self, test_message, success_prompt, cr_green, cr_bold, cr_reset) -> None:
-        """
-        Test success_message with default color.
-
-        This test verifies that the success_message function returns a string formatted
-        with green text when no color is specified.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            success_prompt (str): The standard success prompt provided by the fixture.
-            cr_green (str): The ANSI escape code for green color provided by the fixture.
-            cr_bold (str): The ANSI escape code for bold provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for green color and the success prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = success_message(message=test_message)
-
-        assert result.startswith(f"[ {cr_green}{cr_bold}{success_prompt}{cr_reset} ]")  # nosec: B101
-        assert result.endswith(test_message)  # nosec: B101
-
-    def test_success_message_custom_color_whole_message(self, test_message, success_prompt, whole_message, custom_color, cr_custom_color, cr_reset) -> None:
-        """
-        Test success_message with custom color applied to the whole message.
-
-        This test verifies that the success_message function returns a string formatted
-        with a custom color when 'blue+bold' is specified as the color.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            success_prompt (str): The standard success prompt provided by the fixture.
-            whole_message (str): The 'whole message' scope provided by the fixture.
-            custom_color (str): The custom color string 'blue+bold' provided by the fixture.
-            cr_custom_color (str): The ANSI escape code for custom color provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for custom color and the success prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = success_message(message=test_message, color=custom_color, scope=whole_message)
-
-        assert result.startswith(f"{cr_custom_color}[ {success_prompt} ]")  # nosec: B101
-        assert result.endswith(f"{test_message}{cr_reset}")  # nosec: B101
-
-    def test_success_message_custom_color_whole_prompt(self, test_message, success_prompt, whole_prompt, custom_color, cr_custom_color, cr_reset) -> None:
-        """
-        Test success_message with custom color applied to the whole prompt.
-
-        This test verifies that the success_message function returns a string formatted
-        with custom color applied to the whole prompt when 'blue' is specified as the color.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            success_prompt (str): The standard success prompt provided by the fixture.
-            whole_prompt (str): The 'whole prompt' scope provided by the fixture.
-            custom_color (str): The custom color string 'blue' provided by the fixture.
-            cr_custom_color (str): The ANSI escape code for custom color provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for custom color and the success prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = success_message(message=test_message, color=custom_color, scope=whole_prompt)
-
-        assert result.startswith(f"{cr_custom_color}[ {success_prompt} ]{cr_reset} {test_message}")  # nosec: B101
-
-    def test_success_message_custom_color_inside_brackets(self, test_message, success_prompt, inside_brackets, custom_color, cr_custom_color, cr_reset) -> None:
-        """
-        Test success_message with custom color applied inside brackets.
-
-        This test verifies that the success_message function returns a string formatted
-        with custom color applied inside the brackets when 'blue' is specified as the color.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            success_prompt (str): The standard success prompt provided by the fixture.
-            inside_brackets (str): The 'inside brackets' scope provided by the fixture.
-            custom_color (str): The custom color string 'blue' provided by the fixture.
-            cr_custom_color (str): The ANSI escape code for custom color provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for custom color inside the brackets.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = success_message(message=test_message, color=custom_color, scope=inside_brackets)
-
-        assert result.startswith(f"[ {cr_custom_color}{success_prompt}{cr_reset} ] {test_message}")  # nosec: B101
-
-    def test_custom_prompt_success_message(self, test_message, custom_prompt, inside_brackets, cr_green, cr_bold, cr_reset) -> None:
-        """
-        Test success_message with a custom prompt.
-
-        This test verifies that the success_message function returns a string formatted
-        with a custom prompt.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            custom_prompt (str): The custom prompt provided by the fixture.
-            inside_brackets (str): The 'inside brackets' scope provided by the fixture.
-            cr_green (str): The ANSI escape code for green color provided by the fixture.
-            cr_bold (str): The ANSI escape code for bold provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for green color and the custom prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = success_message(message=test_message, prompt=custom_prompt, scope=inside_brackets)
-
-        assert result.startswith(f"[ {cr_green}{cr_bold}{custom_prompt}{cr_reset} ] {test_message}")  # nosec: B101
-
-    def test_success_message_invalid_color(self) -> None:
-        """
-        Test success_message with invalid color.
-
-        This test verifies that the success_message function raises a NotifyValueError
-        when an invalid color is specified.
-
-        Asserts:
-            A NotifyValueError is raised with the appropriate error message.
-        """
-        with pytest.raises(NotifyValueError, match=re.escape("Invalid color component 'invalid'")):
-            success_message("Operation completed successfully.", "invalid")
-
-
-class TestWarningMessages:
-    """
-    Grouped tests for success_message function.
-    """
+        assert result == f"{custom_prompt_prefix}{DEFAULT_COLORS[level]}{CR_BOLD}{prompt}{CR_RESET}{custom_prompt_suffix} {test_message}"  # nosec: B101
 
-    def test_warning_message_default_color(self, test_message, warning_prompt, cr_yellow, cr_bold, cr_reset) -> None:
-        """
-        Test warning_message with default color.
-
-        This test verifies that the warning_message function returns a string formatted
-        with yellow text when no color is specified.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            warning_prompt (str): The standard warning prompt provided by the fixture.
-            cr_yellow (str): The ANSI escape code for yellow color provided by the fixture.
-            cr_bold (str): The ANSI escape code for bold provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for yellow color and the warning prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = warning_message(message=test_message)
-
-        assert result.startswith(f"[ {cr_yellow}{cr_bold}{warning_prompt}{cr_reset} ]")  # nosec: B101
-        assert result.endswith(test_message)  # nosec: B101
-
-    def test_warning_message_custom_color(self, test_message, warning_prompt, whole_message, custom_color, cr_custom_color, cr_reset) -> None:
-        """
-        Test warning_message with custom color.
-
-        This test verifies that the warning_message function returns a string formatted
-        with custom color when 'red+bold' is specified as the color.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            warning_prompt (str): The standard warning prompt provided by the fixture.
-            whole_message (str): The 'whole message' scope provided by the fixture.
-            custom_color (str): The custom color string 'red+bold' provided by the fixture.
-            cr_custom_color (str): The ANSI escape code for custom color provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for custom color and the warning prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = warning_message(message=test_message, color=custom_color, scope=whole_message)
-
-        assert result.startswith(f"{cr_custom_color}[ {warning_prompt} ]")  # nosec: B101
-        assert result.endswith(f"{test_message}{cr_reset}")  # nosec: B101
-
-    def test_warning_message_custom_color_whole_prompt(self, test_message, warning_prompt, whole_prompt, custom_color, cr_custom_color, cr_reset) -> None:
-        """
-        Test warning_message with custom color applied to the whole prompt.
-
-        This test verifies that the warning_message function returns a string formatted
-        with custom color applied to the whole prompt when 'blue' is specified as the color.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            warning_prompt (str): The standard warning prompt provided by the fixture.
-            whole_prompt (str): The 'whole prompt' scope provided by the fixture.
-            custom_color (str): The custom color string 'blue' provided by the fixture.
-            cr_custom_color (str): The ANSI escape code for custom color provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for custom color and the warning prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = warning_message(message=test_message, color=custom_color, scope=whole_prompt)
-
-        assert result.startswith(f"{cr_custom_color}[ {warning_prompt} ]{cr_reset} {test_message}")  # nosec: B101
-
-    def test_warning_message_custom_color_inside_brackets(self, test_message, warning_prompt, inside_brackets, custom_color, cr_custom_color, cr_reset) -> None:
-        """
-        Test warning_message with custom color applied inside brackets.
-
-        This test verifies that the warning_message function returns a string formatted
-        with custom color applied inside the brackets when 'blue' is specified as the color.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            warning_prompt (str): The standard warning prompt provided by the fixture.
-            inside_brackets (str): The 'inside brackets' scope provided by the fixture.
-            custom_color (str): The custom color string 'blue' provided by the fixture.
-            cr_custom_color (str): The ANSI escape code for custom color provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for custom color inside the brackets.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = warning_message(message=test_message, color=custom_color, scope=inside_brackets)
-
-        assert result.startswith(f"[ {cr_custom_color}{warning_prompt}{cr_reset} ] {test_message}")  # nosec: B101
-
-    def test_custom_prompt_warning_message(self, test_message, custom_prompt, inside_brackets, cr_yellow, cr_bold, cr_reset) -> None:
-        """
-        Test warning_message with a custom prompt.
-
-        This test verifies that the warning_message function returns a string formatted
-        with a custom prompt.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            custom_prompt (str): The custom prompt provided by the fixture.
-            inside_brackets (str): The 'inside brackets' scope provided by the fixture.
-            cr_yellow (str): The ANSI escape code for yellow color provided by the fixture.
-            cr_bold (str): The ANSI escape code for bold provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for yellow color and the custom prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = warning_message(message=test_message, prompt=custom_prompt, scope=inside_brackets)
-
-        assert result.startswith(f"[ {cr_yellow}{cr_bold}{custom_prompt}{cr_reset} ] {test_message}")  # nosec: B101
-
-    def test_warning_message_invalid_color(self) -> None:
-        """
-        Test warning_message with invalid color.
-
-        This test verifies that the warning_message function raises a NotifyValueError
-        when an invalid color is specified.
-
-        Asserts:
-            A NotifyValueError is raised with the appropriate error message.
-        """
-        with pytest.raises(NotifyValueError, match=re.escape("Invalid color component 'invalid'")):
-            warning_message("This is a warning message.", "invalid")
-
-
-class TestErrorMessages:
-    """
-    Grouped tests for success_message function.
-    """
+    def test_invalid_color(self, level, test_message) -> None:
+        """Test a message function with an invalid color."""
+        with pytest.raises(NotifyValueError) as exc_info:
+            MESSAGE_FUNCTIONS[level](test_message, "invalid")
 
-    def test_error_message_default_color(self, test_message, error_prompt, cr_red, cr_bold, cr_reset) -> None:
-        """
-        Test error_message with default color.
-
-        This test verifies that the error_message function returns a string formatted
-        with red text when no color is specified.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            error_prompt (str): The standard error prompt provided by the fixture.
-            cr_red (str): The ANSI escape code for red color provided by the fixture.
-            cr_bold (str): The ANSI escape code for bold provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for red color and the error prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = error_message(message=test_message)
-
-        assert result.startswith(f"[ {cr_red}{cr_bold}{error_prompt}{cr_reset} ]")  # nosec: B101
-        assert result.endswith(test_message)  # nosec: B101
-
-    def test_error_message_custom_color(self, test_message, error_prompt, whole_message, custom_color, cr_custom_color, cr_reset) -> None:
-        """
-        Test error_message with custom color.
-
-        This test verifies that the error_message function returns a string formatted
-        with custom color when 'cyan+bold' is specified as the color.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            error_prompt (str): The standard error prompt provided by the fixture.
-            whole_message (str): The 'whole message' scope provided by the fixture.
-            custom_color (str): The custom color string 'cyan+bold' provided by the fixture.
-            cr_custom_color (str): The ANSI escape code for custom color provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for custom color and the error prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = error_message(message=test_message, color=custom_color, scope=whole_message)
-
-        assert result.startswith(f"{cr_custom_color}[ {error_prompt} ]")  # nosec: B101
-        assert result.endswith(f"{test_message}{cr_reset}")  # nosec: B101
-
-    def test_error_message_custom_color_whole_prompt(self, test_message, error_prompt, whole_prompt, custom_color, cr_custom_color, cr_reset) -> None:
-        """
-        Test error_message with custom color applied to the whole prompt.
-
-        This test verifies that the error_message function returns a string formatted
-        with custom color applied to the whole prompt when 'blue' is specified as the color.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            error_prompt (str): The standard error prompt provided by the fixture.
-            whole_prompt (str): The 'whole prompt' scope provided by the fixture.
-            custom_color (str): The custom color string 'blue' provided by the fixture.
-            cr_custom_color (str): The ANSI escape code for custom color provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for custom color and the error prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = error_message(message=test_message, color=custom_color, scope=whole_prompt)
-
-        assert result.startswith(f"{cr_custom_color}[ {error_prompt} ]{cr_reset} {test_message}")  # nosec: B101
-
-    def test_error_message_custom_color_inside_brackets(self, test_message, error_prompt, inside_brackets, custom_color, cr_custom_color, cr_reset) -> None:
-        """
-        Test error_message with custom color applied inside brackets.
-
-        This test verifies that the error_message function returns a string formatted
-        with custom color applied inside the brackets when 'blue' is specified as the color.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            error_prompt (str): The standard error prompt provided by the fixture.
-            inside_brackets (str): The 'inside brackets' scope provided by the fixture.
-            custom_color (str): The custom color string 'blue' provided by the fixture.
-            cr_custom_color (str): The ANSI escape code for custom color provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for custom color inside the brackets.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = error_message(message=test_message, color=custom_color, scope=inside_brackets)
-
-        assert result.startswith(f"[ {cr_custom_color}{error_prompt}{cr_reset} ] {test_message}")  # nosec: B101
-
-    def test_custom_prompt_error_message(self, test_message, custom_prompt, inside_brackets, cr_red, cr_bold, cr_reset) -> None:
-        """
-        Test error_message with a custom prompt.
-
-        This test verifies that the error_message function returns a string formatted
-        with a custom prompt.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            custom_prompt (str): The custom prompt provided by the fixture.
-            inside_brackets (str): The 'inside brackets' scope provided by the fixture.
-            cr_red (str): The ANSI escape code for red color provided by the fixture.
-            cr_bold (str): The ANSI escape code for bold provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for red color and the custom prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = error_message(message=test_message, prompt=custom_prompt, scope=inside_brackets)
-
-        assert result.startswith(f"[ {cr_red}{cr_bold}{custom_prompt}{cr_reset} ] {test_message}")  # nosec: B101
-
-    def test_error_message_invalid_color(self) -> None:
-        """
-        Test error_message with invalid color.
-
-        This test verifies that the error_message function raises a NotifyValueError
-        when an invalid color is specified.
-
-        Asserts:
-            A NotifyValueError is raised with the appropriate error message.
-        """
-        with pytest.raises(NotifyValueError, match=re.escape("Invalid color component 'invalid'")):
-            error_message("An error occurred.", "invalid")
-
-    def test_failure_message(self, test_message, failure_prompt, cr_red, cr_bold, cr_reset) -> None:
-        """
-        Test failure_message alias.
-
-        This test verifies that the failure_message function (alias for error_message)
-        returns a string formatted with bold red text.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            error_prompt (str): The standard error prompt provided by the fixture.
-            cr_red (str): The ANSI escape code for red color provided by the fixture.
-            cr_bold (str): The ANSI escape code for bold provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for red color and the error prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = failure_message(message=test_message)
-
-        assert result.startswith(f"[ {cr_red}{cr_bold}{failure_prompt}{cr_reset} ]")  # nosec: B101
-        assert result.endswith(test_message)  # nosec: B101
-
-
-class TestInfoMessages:
-    """
-    Grouped tests for success_message function.
-    """
+        assert INVALID_COLOR_MESSAGE in str(exc_info.value)  # nosec: B101
 
-    def test_info_message_default_color(self, test_message, info_prompt, cr_cyan, cr_bold, cr_reset) -> None:
-        """
-        Test info_message with default color.
-
-        This test verifies that the info_message function returns a string formatted
-        with cyan text when no color is specified.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            info_prompt (str): The standard info prompt provided by the fixture.
-            cr_cyan (str): The ANSI escape code for cyan color provided by the fixture.
-            cr_bold (str): The ANSI escape code for bold provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for cyan color and the info prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = info_message(message=test_message)
-
-        assert result.startswith(f"[ {cr_cyan}{cr_bold}{info_prompt}{cr_reset} ]")  # nosec: B101
-        assert result.endswith(test_message)  # nosec: B101
-
-    def test_info_message_custom_color(self, test_message, info_prompt, whole_message, custom_color, cr_custom_color, cr_reset) -> None:
-        """
-        Test info_message with custom color.
-
-        This test verifies that the info_message function returns a string formatted
-        with custom color when 'green+bold' is specified as the color.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            info_prompt (str): The standard info prompt provided by the fixture.
-            whole_message (str): The 'whole message' scope provided by the fixture.
-            custom_color (str): The custom color string 'green+bold' provided by the fixture.
-            cr_custom_color (str): The ANSI escape code for custom color provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for custom color and the info prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = info_message(test_message, custom_color, scope=whole_message)
-
-        assert result.startswith(f"{cr_custom_color}[ {info_prompt} ]")  # nosec: B101
-        assert result.endswith(f"{test_message}{cr_reset}")  # nosec: B101
-
-    def test_info_message_custom_color_whole_prompt(self, test_message, info_prompt, whole_prompt, custom_color, cr_custom_color, cr_reset) -> None:
-        """
-        Test info_message with custom color applied to the whole prompt.
-
-        This test verifies that the info_message function returns a string formatted
-        with custom color applied to the whole prompt when 'blue' is specified as the color.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            info_prompt (str): The standard info prompt provided by the fixture.
-            whole_prompt (str): The 'whole prompt' scope provided by the fixture.
-            custom_color (str): The custom color string 'blue' provided by the fixture.
-            cr_custom_color (str): The ANSI escape code for custom color provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for custom color and the info prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = info_message(test_message, custom_color, scope=whole_prompt)
-
-        assert result.startswith(f"{cr_custom_color}[ {info_prompt} ]{cr_reset} {test_message}")  # nosec: B101
-
-    def test_info_message_custom_color_inside_brackets(self, test_message, info_prompt, inside_brackets, custom_color, cr_custom_color, cr_reset) -> None:
-        """
-        Test info_message with custom color applied inside brackets.
-
-        This test verifies that the info_message function returns a string formatted
-        with custom color applied inside the brackets when 'blue' is specified as the color.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            info_prompt (str): The standard info prompt provided by the fixture.
-            inside_brackets (str): The 'inside brackets' scope provided by the fixture.
-            custom_color (str): The custom color string 'blue' provided by the fixture.
-            cr_custom_color (str): The ANSI escape code for custom color provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for custom color inside the brackets.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = info_message(test_message, custom_color, scope=inside_brackets)
-
-        assert result.startswith(f"[ {cr_custom_color}{info_prompt}{cr_reset} ] {test_message}")  # nosec: B101
-
-    def test_custom_prompt_info_message(self, test_message, custom_prompt, inside_brackets, cr_cyan, cr_bold, cr_reset) -> None:
-        """
-        Test info_message with a custom prompt.
-
-        This test verifies that the info_message function returns a string formatted
-        with a custom prompt.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            custom_prompt (str): The custom prompt provided by the fixture.
-            inside_brackets (str): The 'inside brackets' scope provided by the fixture.
-            cr_cyan (str): The ANSI escape code for cyan color provided by the fixture.
-            cr_bold (str): The ANSI escape code for bold provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for cyan color and the custom prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = info_message(test_message, prompt=custom_prompt, scope=inside_brackets)
-
-        assert result.startswith(f"[ {cr_cyan}{cr_bold}{custom_prompt}{cr_reset} ] {test_message}")  # nosec: B101
-
-    def test_info_message_invalid_color(self) -> None:
-        """
-        Test info_message with invalid color.
-
-        This test verifies that the info_message function raises a NotifyValueError
-        when an invalid color is specified.
-
-        Asserts:
-            A NotifyValueError is raised with the appropriate error message.
-        """
-        with pytest.raises(NotifyValueError, match=re.escape("Invalid color component 'invalid'")):
-            info_message("This is some information.", "invalid")
-
-
-class TestSystemMessages:
-    """
-    Grouped tests for success_message function.
-    """
+    def test_positional_arguments(self, level, test_message, custom_color, custom_prompt) -> None:
+        """Test a message function with the color and prompt passed positionally."""
+        result: str = MESSAGE_FUNCTIONS[level](test_message, custom_color, custom_prompt)
+
+        assert result == f"[ {CR_CUSTOM}{custom_prompt}{CR_RESET} ] {test_message}"  # nosec: B101
+
+    def test_exception_message(
+        self,
+        level,
+        test_message,
+        custom_color,
+        constants,
+        expected_default_messages
+    ) -> None:
+        """Test a message function with an exception passed as the message."""
+        assert MESSAGE_FUNCTIONS[level](ValueError(test_message)) == expected_default_messages[level]  # nosec: B101
+
+        prompt: str = constants[f"{level}_prompt"]
+        result: str = MESSAGE_FUNCTIONS[level](ValueError(test_message), custom_color)
+        assert result == f"[ {CR_CUSTOM}{prompt}{CR_RESET} ] {test_message}"  # nosec: B101
 
-    def test_system_message_default_color(self, test_message, system_prompt, cr_grey, cr_bold, cr_reset) -> None:
-        """
-        Test system_message with default color.
-
-        This test verifies that the system_message function returns a string formatted
-        with grey text when no color is specified.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            system_prompt (str): The standard system prompt provided by the fixture.
-            cr_grey (str): The ANSI escape code for grey color provided by the fixture.
-            cr_bold (str): The ANSI escape code for bold provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for grey color and the system prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = system_message(test_message)
-
-        assert result.startswith(f"[ {cr_grey}{cr_bold}{system_prompt}{cr_reset} ]")  # nosec: B101
-        assert result.endswith(test_message)  # nosec: B101
-
-    def test_system_message_custom_color(self, test_message, system_prompt, whole_message, custom_color, cr_custom_color, cr_reset) -> None:
-        """
-        Test system_message with custom color.
-
-        This test verifies that the system_message function returns a string formatted
-
-
-        with custom color when 'magenta+bold' is specified as the color.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            system_prompt (str): The standard system prompt provided by the fixture.
-            whole_message (str): The 'whole message' scope provided by the fixture.
-            custom_color (str): The custom color string 'magenta+bold' provided by the fixture.
-            cr_custom_color (str): The ANSI escape code for custom color provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for custom color and the system prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = system_message(test_message, custom_color, scope=whole_message)
-
-        assert result.startswith(f"{cr_custom_color}[ {system_prompt} ]")  # nosec: B101
-        assert result.endswith(f"{test_message}{cr_reset}")  # nosec: B101
-
-    def test_system_message_custom_color_whole_prompt(self, test_message, system_prompt, whole_prompt, custom_color, cr_custom_color, cr_reset) -> None:
-        """
-        Test system_message with custom color applied to the whole prompt.
-
-        This test verifies that the system_message function returns a string formatted
-        with custom color applied to the whole prompt when 'blue' is specified as the color.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            system_prompt (str): The standard system prompt provided by the fixture.
-            whole_prompt (str): The 'whole prompt' scope provided by the fixture.
-            custom_color (str): The custom color string 'blue' provided by the fixture.
-            cr_custom_color (str): The ANSI escape code for custom color provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for custom color and the system prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = system_message(test_message, custom_color, scope=whole_prompt)
-
-        assert result.startswith(f"{cr_custom_color}[ {system_prompt} ]{cr_reset} {test_message}")  # nosec: B101
-
-    def test_system_message_custom_color_inside_brackets(self, test_message, system_prompt, inside_brackets, custom_color, cr_custom_color, cr_reset) -> None:
-        """
-        Test system_message with custom color applied inside brackets.
-
-        This test verifies that the system_message function returns a string formatted
-        with custom color applied inside the brackets when 'blue' is specified as the color.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            system_prompt (str): The standard system prompt provided by the fixture.
-            inside_brackets (str): The 'inside brackets' scope provided by the fixture.
-            custom_color (str): The custom color string 'blue' provided by the fixture.
-            cr_custom_color (str): The ANSI escape code for custom color provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for custom color inside the brackets.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = system_message(test_message, custom_color, scope=inside_brackets)
-
-        assert result.startswith(f"[ {cr_custom_color}{system_prompt}{cr_reset} ] {test_message}")  # nosec: B101
-
-    def test_custom_prompt_system_message(self, test_message, custom_prompt, inside_brackets, cr_grey, cr_bold, cr_reset) -> None:
-        """
-        Test system_message with a custom prompt.
-
-        This test verifies that the system_message function returns a string formatted
-        with a custom prompt.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            custom_prompt (str): The custom prompt provided by the fixture.
-            inside_brackets (str): The 'inside brackets' scope provided by the fixture.
-            cr_grey (str): The ANSI escape code for grey color provided by the fixture.
-            cr_bold (str): The ANSI escape code for bold provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string starts with the expected ANSI code for grey color and the custom prompt.
-            The result string ends with the test message followed by the ANSI reset code.
-        """
-        result: str = system_message(test_message, prompt=custom_prompt, scope=inside_brackets)
-
-        assert result.startswith(f"[ {cr_grey}{cr_bold}{custom_prompt}{cr_reset} ] {test_message}")  # nosec: B101
+    def test_non_string_prompt(self, level, test_message) -> None:
+        """Test a message function with a non-string prompt."""
+        assert MESSAGE_FUNCTIONS[level](test_message, prompt=3) == f"[ {DEFAULT_COLORS[level]}{CR_BOLD}3{CR_RESET} ] {test_message}"  # nosec: B101
 
-    def test_system_message_invalid_color(self) -> None:
-        """
-        Test system_message with invalid color.
+    def test_default_bytes(self, level, test_message, expected_default_messages) -> None:
+        """Test the bytes variant of a message function with its default style."""
+        assert BYTES_FUNCTIONS[level](test_message) == f"{expected_default_messages[level]}\n".encode('utf-8')  # nosec: B101
+        assert BYTES_FUNCTIONS[level](ValueError(test_message)) == f"{expected_default_messages[level]}\n".encode('utf-8')  # nosec: B101
 
-        This test verifies that the system_message function raises a NotifyValueError
-        when an invalid color is specified.
-
-        Asserts:
-            A NotifyValueError is raised with the appropriate error message.
-        """
-        with pytest.raises(NotifyValueError, match=re.escape("Invalid color component 'invalid'")):
-            system_message("System update available.", "invalid")
+    def test_bytes_match_message(self, level, test_message) -> None:
+        """Test the bytes variant of a message function encodes exactly what the message function returns."""
+        assert BYTES_FUNCTIONS[level](test_message) == f"{MESSAGE_FUNCTIONS[level](test_message)}\n".encode('utf-8')  # nosec: B101
 
 
+@pytest.mark.xdist_group(name="notify_tests")
 class TestOther:
     """
     Grouped tests for success_message function.
     """
 
-    def test_custom_prompt_prefix_suffix(
-        self,
-        test_message,
-        custom_prompt_prefix,
-        custom_prompt_suffix,
-        success_prompt,
-        warning_prompt,
-        error_prompt,
-        info_prompt,
-        system_prompt,
-        cr_green,
-        cr_yellow,
-        cr_red,
-        cr_cyan,
-        cr_grey,
-        cr_bold,
-        cr_reset
-    ) -> None:
-        """
-        Test message functions with custom prompt prefix and suffix.
-
-        This test verifies that the message functions return strings formatted
-        with custom prompt prefixes and suffixes.
-
-        Arguments:
-            test_message (str): The standard test message provided by the fixture.
-            custom_prompt_prefix (str): The custom prompt prefix provided by the fixture.
-            custom_prompt_suffix (str): The custom prompt suffix provided by the fixture.
-            success_prompt (str): The standard success prompt provided by the fixture.
-            warning_prompt (str): The standard warning prompt provided by the fixture.
-            error_prompt (str): The standard error prompt provided by the fixture.
-            info_prompt (str): The standard info prompt provided by the fixture.
-            system_prompt (str): The standard system prompt provided by the fixture.
-            cr_green (str): The ANSI escape code for green color provided by the fixture.
-            cr_yellow (str): The ANSI escape code for yellow color provided by the fixture.
-            cr_red (str): The ANSI escape code for red color provided by the fixture.
-            cr_cyan (str): The ANSI escape code for cyan color provided by the fixture.
-            cr_grey (str): The ANSI escape code for grey color provided by the fixture.
-            cr_bold (str): The ANSI escape code for bold provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The result string for each message function starts with the expected ANSI code for the respective color and custom prompt prefix and suffix.
-            The result string for each message function ends with the test message followed by the ANSI reset code.
-        """
-        result: str = success_message(test_message, prompt_prefix=custom_prompt_prefix, prompt_suffix=custom_prompt_suffix)
-        assert result.startswith(f"{custom_prompt_prefix}{cr_green}{cr_bold}{success_prompt}{cr_reset}{custom_prompt_suffix}")  # nosec: B101
-        assert result.endswith(test_message)  # nosec: B101
-
-        result = warning_message(test_message, prompt_prefix=custom_prompt_prefix, prompt_suffix=custom_prompt_suffix)
-        assert result.startswith(f"{custom_prompt_prefix}{cr_yellow}{cr_bold}{warning_prompt}{cr_reset}{custom_prompt_suffix}")  # nosec: B101
-        assert result.endswith(test_message)  # nosec: B101
-
-        result = error_message(test_message, prompt_prefix=custom_prompt_prefix, prompt_suffix=custom_prompt_suffix)
-        assert result.startswith(f"{custom_prompt_prefix}{cr_red}{cr_bold}{error_prompt}{cr_reset}{custom_prompt_suffix}")  # nosec: B101
-        assert result.endswith(test_message)  # nosec: B101
-
-        result = info_message(test_message, prompt_prefix=custom_prompt_prefix, prompt_suffix=custom_prompt_suffix)
-        assert result.startswith(f"{custom_prompt_prefix}{cr_cyan}{cr_bold}{info_prompt}{cr_reset}{custom_prompt_suffix}")  # nosec: B101
-        assert result.endswith(test_message)  # nosec: B101
-
-        result = system_message(test_message, prompt_prefix=custom_prompt_prefix, prompt_suffix=custom_prompt_suffix)
-        assert result.startswith(f"{custom_prompt_prefix}{cr_grey}{cr_bold}{system_prompt}{cr_reset}{custom_prompt_suffix}")  # nosec: B101
-        assert result.endswith(test_message)  # nosec: B101
-
-    def test_get_color_codes_valid(self, custom_color_bold, cr_custom_color, cr_bold, cr_reset) -> None:
-        """
-        Test get_color_codes with valid color format.
-
-        This test verifies that the get_color_codes function returns the correct ANSI
-        codes for a valid color format.
-
-        Arguments:
-            custom_color_bold (str): The custom color string 'blue+bold' provided by the fixture.
-            cr_custom_color (str): The ANSI escape code for custom color provided by the fixture.
-            cr_bold (str): The ANSI escape code for bold style provided by the fixture.
-            cr_reset (str): The ANSI reset code provided by the fixture.
-
-        Asserts:
-            The returned color code matches the expected custom color and bold style.
-            The returned reset code matches the expected reset code.
-        """
-        codes: dict = get_color_codes(custom_color_bold)
-
-        assert codes['color'] == f"{cr_custom_color}{cr_bold}"  # nosec: B101
-        assert codes['reset'] == cr_reset  # nosec: B101
+    def test_get_color_codes_valid(self, custom_color_bold) -> None:
+        """Test get_color_codes with valid color format."""
+        color_code, reset_code = get_color_codes(custom_color_bold)
 
-    def test_get_color_codes_invalid_format(self) -> None:
-        """
-        Test get_color_codes with invalid format.
-
-        This test verifies that the get_color_codes function raises a NotifyValueError
-        when an invalid format is provided.
+        assert color_code == f"{CR_CUSTOM}{CR_BOLD}"  # nosec: B101
+        assert reset_code == CR_RESET  # nosec: B101
 
-        Asserts:
-            A NotifyValueError is raised with the appropriate error message.
-        """
-        with pytest.raises(NotifyValueError, match=re.escape("Invalid color format. Use 'color', 'color+bold', or 'bold'.")):
+    def test_get_color_codes_invalid_format(self) -> None:
+        """Test get_color_codes with invalid format."""
+        with pytest.raises(NotifyValueError) as exc_info:
             get_color_codes("red+blue")
 
-    def test_get_color_codes_invalid_component(self) -> None:
-        """
-        Test get_color_codes with invalid color component.
+        assert INVALID_FORMAT_MESSAGE in str(exc_info.value)  # nosec: B101
 
-        This test verifies that the get_color_codes function raises a NotifyValueError
-        when an invalid color component is specified.
+    def test_get_color_codes_invalid_component(self) -> None:
+        """Test get_color_codes with invalid color component."""
+        with pytest.raises(NotifyValueError) as exc_info:
+            get_color_codes("invalid")
 
-        Asserts:
-            A NotifyValueError is raised with the appropriate error message.
-        """
-        with pytest.raises(NotifyValueError, match=re.escape("Invalid color component 'invalid'")):
+        assert INVALID_COLOR_MESSAGE in str(exc_info.value)  # nosec: B101
+
+    @pytest.mark.parametrize("color, canonical_color", SANITIZED_COLORS)
+    def test_get_color_codes_sanitized(self, color, canonical_color) -> None:
+        """Test get_color_codes sanitizes a specification to the same codes as its canonical spelling."""
+        assert get_color_codes(color) == get_color_codes(canonical_color)  # nosec: B101
+
+    @pytest.mark.parametrize("color, invalid_part", SANITIZED_INVALID_COLORS)
+    def test_get_color_codes_sanitized_invalid(self, color, invalid_part) -> None:
+        """Test get_color_codes names the sanitized component of a specification that is still invalid."""
+        with pytest.raises(NotifyValueError) as exc_info:
+            get_color_codes(color)
+
+        assert f"Invalid color component '{invalid_part}'" in str(exc_info.value)  # nosec: B101
+
+    def test_get_color_codes_dict(self, custom_color_bold) -> None:
+        """Test the dictionary-returning get_color_codes_dict shim."""
+        assert get_color_codes_dict(custom_color_bold) == {'color': f"{CR_CUSTOM}{CR_BOLD}", 'reset': CR_RESET}  # nosec: B101
+
+    def test_format_many_color_runs(self, test_message, constants) -> None:
+        """Test format_many emits each color once per run of same-colored messages."""
+        result: str = format_many([("success", test_message), ("success", test_message), ("error", test_message), ("failure", test_message)])
+        success_line: str = f"[ {constants['success_prompt']} ] {test_message}"
+        error_line: str = f"[ {constants['error_prompt']} ] {test_message}"
+        failure_line: str = f"[ {constants['failure_prompt']} ] {test_message}"
+
+        assert result == (  # nosec: B101
+            f"{CR_GREEN}{CR_BOLD}{success_line}\n{success_line}{CR_RESET}\n"
+            f"{CR_RED}{CR_BOLD}{error_line}\n{failure_line}{CR_RESET}"
+        )
+
+    def test_format_many_empty(self) -> None:
+        """Test format_many with no messages."""
+        assert format_many([]) == ''  # nosec: B101
+
+    def test_format_many_invalid_level(self, test_message) -> None:
+        """Test format_many with an invalid level."""
+        with pytest.raises(NotifyValueError) as exc_info:
+            format_many([("invalid", test_message)])
+
+        assert INVALID_LEVEL_MESSAGE in str(exc_info.value)  # nosec: B101
+
+    def test_make_style(self, test_message, custom_color, custom_prompt, whole_message) -> None:
+        """Test a style made with make_style formats messages like the matching message function."""
+        style: Style = make_style(custom_color, custom_prompt, whole_message)
+
+        assert style.apply(test_message) == success_message(test_message, custom_color, custom_prompt, whole_message)  # nosec: B101
+        assert style == Style(f"{CR_CUSTOM}[ {custom_prompt} ] ", CR_RESET)  # nosec: B101
+
+    def test_make_style_invalid_color(self, custom_prompt) -> None:
+        """Test make_style validates the color when the style is made."""
+        with pytest.raises(NotifyValueError) as exc_info:
+            make_style("invalid", custom_prompt)
+
+        assert INVALID_COLOR_MESSAGE in str(exc_info.value)  # nosec: B101
+
+    def test_notify_value_error_kinds(self) -> None:
+        """Test NotifyValueError formats a known error kind into its message and arguments."""
+        message: str = "Invalid level 'invalid'. Allowed values are: success"
+        error: NotifyValueError = NotifyValueError("invalid_level", "invalid", "success")
+
+        assert str(error) == message  # nosec: B101
+        assert error.args == (message,)  # nosec: B101
+        assert repr(error) == f"NotifyValueError({message!r})"  # nosec: B101
+        assert (error.kind, error.values) == ("invalid_level", ("invalid", "success"))  # nosec: B101
+        assert str(NotifyValueError("invalid_format")) == INVALID_FORMAT_MESSAGE  # nosec: B101
+
+    def test_notify_value_error_free_text(self) -> None:
+        """Test NotifyValueError passes a plain message, and anything that does not fit a template, through like ValueError."""
+        assert str(NotifyValueError("Something went wrong.")) == "Something went wrong."  # nosec: B101
+        assert str(NotifyValueError("Bad value {x}", 3)) == str(ValueError("Bad value {x}", 3))  # nosec: B101
+        assert NotifyValueError("Bad value", 3).args == ("Bad value", 3)  # nosec: B101
+        assert str(NotifyValueError("invalid_component")) == "invalid_component"  # nosec: B101
+
+    def test_notify_value_error_is_value_error(self) -> None:
+        """Test NotifyValueError can be caught as a ValueError."""
+        with pytest.raises(ValueError):
             get_color_codes("invalid")
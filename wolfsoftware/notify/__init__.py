@@ -7,6 +7,7 @@ The main functionalities offered by this module include:
 - Displaying success, warning, error, failure, informational, and system messages.
 - Handling custom exceptions related to notification values.
 - Retrieving the package version using importlib.metadata.
+- Enabling ANSI escape code handling on Windows consoles (via colorama) when the package is imported.
 
 Modules and Functions:
 ----------------------
@@ -16,6 +17,12 @@ Modules and Functions:
 - `failure_message`: Displays a failure message.
 - `info_message`: Displays an informational message.
 - `system_message`: Displays a system message.
+- `make_style`: Resolves and validates a style once, returning a `Style` whose `apply` method formats messages with it.
+- `format_many`: Formats a batch of messages, emitting each color only once per run of same-colored messages.
+- `success_bytes`, `warning_bytes`, `error_bytes`, `failure_bytes`, `info_bytes`, `system_bytes`: Return a default-styled
+  message as UTF-8 bytes with a trailing newline.
+- `get_color_codes`: Returns the ANSI codes for a color specification as a `ColorCodes` named tuple.
+- `get_color_codes_dict`: Returns the same codes as a dictionary, for callers of the earlier dictionary-returning API.
 
 Exceptions:
 -----------
@@ -47,10 +54,34 @@ To handle exceptions, you can use NotifyValueError:
 """
 
 import importlib.metadata
+import sys
 
-from .notify import success_message, warning_message, error_message, failure_message, info_message, system_message
+from .notify import (
+    success_message,
+    warning_message,
+    error_message,
+    failure_message,
+    info_message,
+    system_message,
+    format_many,
+    make_style,
+    Style,
+    success_bytes,
+    warning_bytes,
+    error_bytes,
+    failure_bytes,
+    info_bytes,
+    system_bytes
+)
 from .exceptions import NotifyValueError
-from .utils import get_color_codes
+from .utils import ColorCodes, get_color_codes, get_color_codes_dict
+
+# The messages use raw ANSI escape codes. Other platforms' terminals understand them natively; on Windows,
+# colorama enables virtual terminal processing on the console once (or translates the codes on older consoles).
+if sys.platform == 'win32':
+    from colorama import just_fix_windows_console
+
+    just_fix_windows_console()
 
 try:
     __version__: str = importlib.metadata.version('wolfsoftware.notify')
@@ -64,6 +95,17 @@ __all__: list[str] = [
     'failure_message',
     'info_message',
     'system_message',
+    'format_many',
+    'make_style',
+    'Style',
+    'success_bytes',
+    'warning_bytes',
+    'error_bytes',
+    'failure_bytes',
+    'info_bytes',
+    'system_bytes',
     'get_color_codes',
+    'get_color_codes_dict',
+    'ColorCodes',
     'NotifyValueError'
 ]
@@ -11,8 +11,9 @@ Classes:
 
 Class Details:
 --------------
-- `NotifyValueError`: Inherits from the base Exception class. It is used to signal errors
-  related to invalid values in the notification system.
+- `NotifyValueError`: Inherits from the built-in ValueError class. It is used to signal errors
+  related to invalid values in the notification system. The package raises it with an error
+  kind and the offending values, and the message is built from the matching template in _MESSAGES.
 
 Example Usage:
 --------------
@@ -21,26 +22,74 @@ To use the custom exception class, you can import and raise it as follows:
     from your_module_name import NotifyValueError
 
     if invalid_color_component:
-        raise NotifyValueError("Invalid color component specified.")
+        raise NotifyValueError("invalid_component", component, allowed_values)
+
+    if something_else_is_wrong:
+        raise NotifyValueError("Something else is wrong.")
 
 """
 
+from string import Formatter
+
+# The message template for each kind of error, formatted with the values the exception is raised with.
+_MESSAGES: dict[str, str] = {
+    'invalid_format': "Invalid color format. Use 'color', 'color+bold', or 'bold'.",
+    'invalid_component': "Invalid color component '{0}'. Allowed values are: {1}",
+    'invalid_scope': "Invalid scope. Use 'all', 'prompt', or 'prompt_text'.",
+    'invalid_level': "Invalid level '{0}'. Allowed values are: {1}",
+}
+
+# The number of values each template takes, so a kind is only formatted when it is raised with exactly that many.
+_FIELD_COUNTS: dict[str, int] = {
+    kind: sum(1 for _, field, _, _ in Formatter().parse(template) if field is not None)
+    for kind, template in _MESSAGES.items()
+}
+
 
-class NotifyValueError(Exception):
+class NotifyValueError(ValueError):
     """
     Custom exception class for notification-related value errors.
 
     This exception is raised when an invalid value is encountered within the notification system,
-    such as when specifying an invalid color component for terminal message formatting.
+    such as when specifying an invalid color component for terminal message formatting. It is a
+    ValueError, so callers can also catch it with `except ValueError`.
+
+    The exception stores the kind of error and the values involved. When kind is one of the known error
+    kinds and is given the number of values its template takes, the formatted message becomes the
+    exception's only argument, so args[0], str() and repr() all carry the message. Anything else is
+    passed to ValueError unchanged, so plain messages (and any values given with them) behave exactly
+    as they would for ValueError.
 
     Arguments:
     ----------
-    Exception (type): Inherits from the base Exception class to provide custom error handling.
+    kind (str): The kind of error (a key of _MESSAGES), or a complete error message.
+    values (object): The values to format into the message template.
+
+    Attributes:
+    -----------
+    kind (str): The kind of error, or the complete error message.
+    values (tuple): The values to format into the message template.
 
     Example Usage:
     --------------
     To raise this exception, you can use it as follows:
 
         if invalid_color_component:
-            raise NotifyValueError("Invalid color component specified.")
+            raise NotifyValueError("invalid_component", component, allowed_values)
     """
+
+    def __init__(self, kind: str, *values: object) -> None:
+        """
+        Store the kind of error and its values, and build the message from its template if it has one.
+
+        Arguments:
+        ----------
+        kind (str): The kind of error (a key of _MESSAGES), or a complete error message.
+        values (object): The values to format into the message template.
+        """
+        if _FIELD_COUNTS.get(kind) == len(values):
+            super().__init__(_MESSAGES[kind].format(*values))
+        else:
+            super().__init__(kind, *values)
+        self.kind: str = kind
+        self.values: tuple = values
@@ -10,9 +10,13 @@ Functions:
 - `success_message`: Prints a success message formatted with bold and green text.
 - `warning_message`: Prints a warning message formatted with bold and yellow text.
 - `error_message`: Prints an error message formatted with bold and red text.
-- `failure_message`: Alias for `error_message`, prints an error message formatted with bold and red text.
+- `failure_message`: Prints a failure message formatted with bold and red text.
 - `info_message`: Prints an informational message formatted with bold and cyan text.
 - `system_message`: Prints a system message formatted with bold and grey text.
+- `make_style`: Resolves and validates a style once, returning a `Style` whose `apply` method formats messages with it.
+- `format_many`: Formats a batch of messages, emitting each color only once per run of same-colored messages.
+- `success_bytes`, `warning_bytes`, `error_bytes`, `failure_bytes`, `info_bytes`, `system_bytes`: Return a default-styled
+  message as UTF-8 bytes with a trailing newline, ready to write to a binary stream such as `sys.stdout.buffer`.
 
 Example Usage:
 --------------
@@ -28,204 +32,411 @@ To use the notification functions, you can import them as follows:
 """
 # pylint: disable=relative-beyond-top-level, too-many-arguments
 
-from functools import partial
+from functools import lru_cache
+from typing import Any, Callable, Iterable, NamedTuple, Optional, Protocol
 
-from .utils import get_color_codes
+from .utils import ColorCodes, get_color_codes
 from .exceptions import NotifyValueError
 
 
-def format_message(
-    message: str,
-    prompt: str,
-    color: str,
-    scope: str,
-    prompt_prefix: str,
-    prompt_suffix: str
-) -> str:
+def _fmt_whole_message(prompt: str, color_code: str, reset_code: str, prompt_prefix: str, prompt_suffix: str) -> tuple[str, str]:
     """
-    Format a message with a specific color and scope.
+    Build the text around the message when the color applies to the prompt, its prefix and suffix, and the message.
 
     Arguments:
-        message (str): The message to be printed.
         prompt (str): The prompt to be displayed inside brackets.
-        color (str): The color to apply.
-        scope (str): The scope of the color ('whole message', 'whole prompt', 'inside brackets').
+        color_code (str): The ANSI code(s) of the color to apply.
+        reset_code (str): The ANSI code to reset the text formatting.
         prompt_prefix (str): The prefix to add before the prompt.
         prompt_suffix (str): The suffix to add after the prompt.
 
     Returns:
-        str: The formatted message.
+        tuple[str, str]: The text to place before and after the message.
+    """
+    return f"{color_code}{prompt_prefix}{prompt}{prompt_suffix} ", reset_code
 
-    Raises:
-        NotifyValueError: If an invalid color or scope is provided.
+
+def _fmt_whole_prompt(prompt: str, color_code: str, reset_code: str, prompt_prefix: str, prompt_suffix: str) -> tuple[str, str]:
     """
-    try:
-        codes: dict = get_color_codes(color)
-    except NotifyValueError as err:
-        raise NotifyValueError(f"Invalid color: {err}") from err
+    Build the text around the message when the color applies to the prompt and its prefix and suffix.
 
-    if scope not in ['all', 'prompt', 'prompt_text']:
-        raise NotifyValueError("Invalid scope. Use 'all', 'prompt', or 'prompt_text'.")
+    Arguments:
+        prompt (str): The prompt to be displayed inside brackets.
+        color_code (str): The ANSI code(s) of the color to apply.
+        reset_code (str): The ANSI code to reset the text formatting.
+        prompt_prefix (str): The prefix to add before the prompt.
+        prompt_suffix (str): The suffix to add after the prompt.
 
-    if scope == 'all':
-        return f"{codes['color']}{prompt_prefix}{prompt}{prompt_suffix} {message}{codes['reset']}"
-    if scope == 'prompt':
-        return f"{codes['color']}{prompt_prefix}{prompt}{prompt_suffix}{codes['reset']} {message}"
-    if scope == 'prompt_text':
-        return f"{prompt_prefix}{codes['color']}{prompt}{codes['reset']}{prompt_suffix} {message}"
+    Returns:
+        tuple[str, str]: The text to place before and after the message.
+    """
+    return f"{color_code}{prompt_prefix}{prompt}{prompt_suffix}{reset_code} ", ''
 
-    raise NotifyValueError(f"Unhandled scope: {scope}")
 
+def _fmt_inside_brackets(prompt: str, color_code: str, reset_code: str, prompt_prefix: str, prompt_suffix: str) -> tuple[str, str]:
+    """
+    Build the text around the message when the color applies to the prompt text only.
 
-def success_message(
-    message: str,
-    color: str = 'green+bold',
-    prompt: str = 'Success',
-    scope: str = 'prompt_text',
-    prompt_prefix: str = '[ ',
-    prompt_suffix: str = ' ]'
-) -> str:
+    Arguments:
+        prompt (str): The prompt to be displayed inside brackets.
+        color_code (str): The ANSI code(s) of the color to apply.
+        reset_code (str): The ANSI code to reset the text formatting.
+        prompt_prefix (str): The prefix to add before the prompt.
+        prompt_suffix (str): The suffix to add after the prompt.
+
+    Returns:
+        tuple[str, str]: The text to place before and after the message.
+    """
+    return f"{prompt_prefix}{color_code}{prompt}{reset_code}{prompt_suffix} ", ''
+
+
+# The formatter for each scope, so a scope is resolved with one dict lookup instead of a chain of comparisons.
+# A scope that is missing from the table is invalid, so the same lookup also validates it.
+_SCOPE_DISPATCH: dict[str, Callable[[str, str, str, str, str], tuple[str, str]]] = {
+    'all': _fmt_whole_message,
+    'prompt': _fmt_whole_prompt,
+    'prompt_text': _fmt_inside_brackets,
+}
+
+
+class Style(NamedTuple):
+    """
+    A fully resolved message style: the text placed before and after every message formatted with it.
+
+    A Style is validated once, when it is made with make_style, so formatting a message with it is just
+    a single string build with no color parsing, scope lookup or cache lookup.
+
+    Attributes:
+        prefix (str): The text placed before the message (the colored prompt and the space after it).
+        suffix (str): The text placed after the message (the reset code when the 'all' scope colors the whole message).
+    """
+
+    prefix: str
+    suffix: str
+
+    def apply(self, message: str) -> str:
+        """
+        Format a message with this style.
+
+        Arguments:
+            message (str): The message to be printed.
+
+        Returns:
+            str: The formatted message.
+        """
+        return f"{self.prefix}{message}{self.suffix}"
+
+
+@lru_cache(maxsize=256)
+def _build_prefix_and_suffix(prompt: str, color: str, scope: str, prompt_prefix: str, prompt_suffix: str) -> Style:
     """
-    Print a success message with a specific format.
+    Build the text placed before and after a message for a given style.
 
-    This function outputs a message indicating success, formatted with the specified color and style.
+    An application only uses a handful of distinct styles, so the result is cached and formatting a
+    message with a style that has been seen before is a single cache lookup and one string build.
 
     Arguments:
-        message (str): The success message to be printed.
-        color (str, optional): The color to apply. Default is 'green'.
-        prompt (str, optional): The prompt to use. Default is 'Success'.
-        scope (str, optional): The scope of the color. Default is 'whole message'.
-        prompt_prefix (str, optional): The prefix to add before the prompt. Default is '[ '.
-        prompt_suffix (str, optional): The suffix to add after the prompt. Default is ' ]'.
+        prompt (str): The prompt to be displayed inside brackets.
+        color (str): The color to apply.
+        scope (str): The scope of the color ('all', 'prompt' or 'prompt_text').
+        prompt_prefix (str): The prefix to add before the prompt.
+        prompt_suffix (str): The suffix to add after the prompt.
 
     Returns:
-        str: The formatted success message.
+        Style: The text to place before and after the message.
 
     Raises:
         NotifyValueError: If an invalid color or scope is provided.
     """
-    return format_message(message, prompt, color, scope, prompt_prefix, prompt_suffix)
+    color_code, reset_code = get_color_codes(color)
 
+    builder: Optional[Callable[[str, str, str, str, str], tuple[str, str]]] = _SCOPE_DISPATCH.get(scope)
+    if builder is None:
+        raise NotifyValueError("invalid_scope")
 
-def warning_message(
-    message: str,
-    color: str = 'yellow+bold',
-    prompt: str = 'Warning',
+    return Style(*builder(prompt, color_code, reset_code, prompt_prefix, prompt_suffix))
+
+
+def make_style(
+    color: str,
+    prompt: str,
     scope: str = 'prompt_text',
     prompt_prefix: str = '[ ',
     prompt_suffix: str = ' ]'
-) -> str:
+) -> Style:
     """
-    Print a warning message with a specific format.
-
-    This function outputs a message indicating a warning, formatted with the specified color and style.
+    Resolve and validate a message style once, for formatting many messages with it.
 
     Arguments:
-        message (str): The warning message to be printed.
-        color (str, optional): The color to apply. Default is 'yellow'.
-        prompt (str, optional): The prompt to use. Default is 'Warning'.
-        scope (str, optional): The scope of the color. Default is 'whole message'.
+        color (str): The color to apply.
+        prompt (str): The prompt to be displayed inside brackets.
+        scope (str, optional): The scope of the color ('all', 'prompt' or 'prompt_text'). Default is 'prompt_text'.
         prompt_prefix (str, optional): The prefix to add before the prompt. Default is '[ '.
         prompt_suffix (str, optional): The suffix to add after the prompt. Default is ' ]'.
 
     Returns:
-        str: The formatted warning message.
+        Style: The resolved style; call its apply method to format a message.
 
     Raises:
         NotifyValueError: If an invalid color or scope is provided.
     """
-    return format_message(message, prompt, color, scope, prompt_prefix, prompt_suffix)
+    return _build_prefix_and_suffix(prompt, color, scope, prompt_prefix, prompt_suffix)
 
 
-def error_message(
+def format_message(
     message: str,
-    color: str = 'red+bold',
-    prompt: str = 'Error',
-    scope: str = 'prompt_text',
-    prompt_prefix: str = '[ ',
-    prompt_suffix: str = ' ]'
+    prompt: str,
+    color: str,
+    scope: str,
+    prompt_prefix: str,
+    prompt_suffix: str
 ) -> str:
     """
-    Print an error message with a specific format.
-
-    This function outputs a message indicating an error, formatted with the specified color and style.
+    Format a message with a specific color and scope.
 
     Arguments:
-        message (str): The error message to be printed.
-        color (str, optional): The color to apply. Default is 'red'.
-        prompt (str, optional): The prompt to use. Default is 'Error'.
-        scope (str, optional): The scope of the color. Default is 'whole message'.
-        prompt_prefix (str, optional): The prefix to add before the prompt. Default is '[ '.
-        prompt_suffix (str, optional): The suffix to add after the prompt. Default is ' ]'.
+        message (str): The message to be printed.
+        prompt (str): The prompt to be displayed inside brackets.
+        color (str): The color to apply.
+        scope (str): The scope of the color ('all', 'prompt' or 'prompt_text').
+        prompt_prefix (str): The prefix to add before the prompt.
+        prompt_suffix (str): The suffix to add after the prompt.
 
     Returns:
-        str: The formatted error message.
+        str: The formatted message.
 
     Raises:
         NotifyValueError: If an invalid color or scope is provided.
     """
-    return format_message(message, prompt, color, scope, prompt_prefix, prompt_suffix)
+    prefix, suffix = _build_prefix_and_suffix(prompt, color, scope, prompt_prefix, prompt_suffix)
+    return f"{prefix}{message}{suffix}"
 
 
-# Creating an alias for the function
-failure_message = partial(error_message, prompt='Failure')
+# The default (color, prompt, scope, prompt_prefix, prompt_suffix) arguments of each message function.
+_DEFAULT_STYLES: dict[str, tuple[str, str, str, str, str]] = {
+    'success': ('green+bold', 'Success', 'prompt_text', '[ ', ' ]'),
+    'warning': ('yellow+bold', 'Warning', 'prompt_text', '[ ', ' ]'),
+    'error': ('red+bold', 'Error', 'prompt_text', '[ ', ' ]'),
+    'failure': ('red+bold', 'Failure', 'prompt_text', '[ ', ' ]'),
+    'info': ('cyan+bold', 'Info', 'prompt_text', '[ ', ' ]'),
+    'system': ('grey+bold', 'System', 'prompt_text', '[ ', ' ]'),
+}
 
+# The allowed message levels, joined once for the invalid level error message.
+_ALLOWED_LEVELS_STR: str = ', '.join(_DEFAULT_STYLES.keys())
 
-def info_message(
-    message: str,
-    color: str = 'cyan+bold',
-    prompt: str = 'Info',
-    scope: str = 'prompt_text',
-    prompt_prefix: str = '[ ',
-    prompt_suffix: str = ' ]'
-) -> str:
+
+class _MessageFunction(Protocol):  # pylint: disable=too-few-public-methods
+    """
+    The signature of the generated message functions, so type checkers and IDEs see their real parameters.
+
+    The defaults differ per level, so they are only spelled out in each function's own docstring.
     """
-    Print an informational message with a specific format.
 
-    This function outputs a message indicating information, formatted with the specified color and style.
+    def __call__(
+        self,
+        message: Any,
+        color: str = ...,
+        prompt: str = ...,
+        scope: str = ...,
+        prompt_prefix: str = ...,
+        prompt_suffix: str = ...
+    ) -> str:
+        """
+        Format a message with the level's style, or with the given color, prompt and scope.
+
+        Arguments:
+            message (str): The message to be printed. Any other object, such as an exception, is converted with str().
+            color (str, optional): The color to apply.
+            prompt (str, optional): The prompt to use.
+            scope (str, optional): The scope of the color ('all', 'prompt' or 'prompt_text').
+            prompt_prefix (str, optional): The prefix to add before the prompt.
+            prompt_suffix (str, optional): The suffix to add after the prompt.
+
+        Returns:
+            str: The formatted message.
+
+        Raises:
+            NotifyValueError: If an invalid color or scope is provided.
+        """
+
+
+# The docstring shared by the generated message functions, filled in with each level's wording and defaults.
+_MESSAGE_DOCSTRING: str = """
+    Print {article} {name} message with a specific format.
+
+    This function outputs a message indicating {meaning}, formatted with the specified color and style.
 
     Arguments:
-        message (str): The informational message to be printed.
-        color (str, optional): The color to apply. Default is 'cyan'.
-        prompt (str, optional): The prompt to use. Default is 'Info'.
-        scope (str, optional): The scope of the color. Default is 'whole message'.
-        prompt_prefix (str, optional): The prefix to add before the prompt. Default is '[ '.
-        prompt_suffix (str, optional): The suffix to add after the prompt. Default is ' ]'.
+        message (str): The {name} message to be printed. Any other object, such as an exception, is converted with str().
+        color (str, optional): The color to apply. Default is '{color}'.
+        prompt (str, optional): The prompt to use. Default is '{prompt}'.
+        scope (str, optional): The scope of the color ('all', 'prompt' or 'prompt_text'). Default is '{scope}'.
+        prompt_prefix (str, optional): The prefix to add before the prompt. Default is '{prompt_prefix}'.
+        prompt_suffix (str, optional): The suffix to add after the prompt. Default is '{prompt_suffix}'.
 
     Returns:
-        str: The formatted informational message.
+        str: The formatted {name} message.
 
     Raises:
         NotifyValueError: If an invalid color or scope is provided.
     """
-    return format_message(message, prompt, color, scope, prompt_prefix, prompt_suffix)
 
 
-def system_message(
-    message: str,
-    color: str = 'grey+bold',
-    prompt: str = 'System',
-    scope: str = 'prompt_text',
-    prompt_prefix: str = '[ ',
-    prompt_suffix: str = ' ]'
-) -> str:
+def _make_message_function(level: str, article: str, name: str, meaning: str) -> _MessageFunction:
     """
-    Print a system message with a specific format.
+    Build the message function for a level, with that level's defaults bound into it.
 
-    This function outputs a message indicating a system message, formatted with the specified color and style.
+    The defaults and the precomputed default prompt are bound at import as closure variables, so the
+    returned function reads them without any global or dict lookups, and it calls the prefix
+    cache directly rather than going through format_message. Unlike a functools.partial of
+    format_message, it keeps the public signature, so color, prompt and the rest can still be
+    passed positionally.
 
     Arguments:
-        message (str): The system message to be printed.
-        color (str, optional): The color to apply. Default is 'grey'.
-        prompt (str, optional): The prompt to use. Default is 'System'.
-        scope (str, optional): The scope of the color. Default is 'whole message'.
-        prompt_prefix (str, optional): The prefix to add before the prompt. Default is '[ '.
-        prompt_suffix (str, optional): The suffix to add after the prompt. Default is ' ]'.
+        level (str): The message level, a key of _DEFAULT_STYLES.
+        article (str): The article used in the docstring ('a' or 'an').
+        name (str): The name of the message in the docstring (e.g. 'success').
+        meaning (str): What the message indicates, for the docstring (e.g. 'a warning').
 
     Returns:
-        str: The formatted system message.
+        _MessageFunction: The message function.
+    """
+    default_color, default_prompt, default_scope, default_prompt_prefix, default_prompt_suffix = _DEFAULT_STYLES[level]
+    default_prefix, default_suffix = make_style(default_color, default_prompt, default_scope, default_prompt_prefix, default_prompt_suffix)
+
+    def message_function(
+        message: Any,
+        color: str = default_color,
+        prompt: str = default_prompt,
+        scope: str = default_scope,
+        prompt_prefix: str = default_prompt_prefix,
+        prompt_suffix: str = default_prompt_suffix
+    ) -> str:
+        # Omitted arguments are the very default objects bound above, so identity checks recognise the
+        # default call without building a tuple; equal strings passed explicitly take the cached path below.
+        if (
+            color is default_color
+            and prompt is default_prompt
+            and scope is default_scope
+            and prompt_prefix is default_prompt_prefix
+            and prompt_suffix is default_prompt_suffix
+        ):
+            return f"{default_prefix}{message}{default_suffix}"
+        prefix, suffix = _build_prefix_and_suffix(prompt, color, scope, prompt_prefix, prompt_suffix)
+        return f"{prefix}{message}{suffix}"
+
+    message_function.__name__ = message_function.__qualname__ = f"{level}_message"
+    message_function.__doc__ = _MESSAGE_DOCSTRING.format(
+        article=article,
+        name=name,
+        meaning=meaning,
+        color=default_color,
+        prompt=default_prompt,
+        scope=default_scope,
+        prompt_prefix=default_prompt_prefix,
+        prompt_suffix=default_prompt_suffix
+    )
+    return message_function
+
+
+success_message: _MessageFunction = _make_message_function('success', 'a', 'success', 'success')
+warning_message: _MessageFunction = _make_message_function('warning', 'a', 'warning', 'a warning')
+error_message: _MessageFunction = _make_message_function('error', 'an', 'error', 'an error')
+failure_message: _MessageFunction = _make_message_function('failure', 'a', 'failure', 'a failure')
+info_message: _MessageFunction = _make_message_function('info', 'an', 'informational', 'information')
+system_message: _MessageFunction = _make_message_function('system', 'a', 'system', 'a system message')
+
+
+def format_many(messages: Iterable[tuple[str, str]]) -> str:
+    """
+    Format a batch of messages, one per line, with each message colored as a whole.
+
+    Each entry is a (level, message) pair, where level is one of 'success', 'warning', 'error', 'failure',
+    'info' or 'system', and is formatted with that level's default color and prompt using the 'all' scope.
+    Consecutive messages that share a color are written as a single run, so the color code is emitted once
+    at the start of the run and the reset code once at its end, rather than around every line.
+
+    Arguments:
+        messages (Iterable[tuple[str, str]]): The (level, message) pairs to format.
+
+    Returns:
+        str: The formatted messages separated by newlines, or '' if there are no messages.
 
     Raises:
-        NotifyValueError: If an invalid color or scope is provided.
+        NotifyValueError: If an invalid level is provided.
+    """
+    parts: list[str] = []
+    codes: Optional[ColorCodes] = None
+
+    for level, message in messages:
+        style: Optional[tuple[str, str, str, str, str]] = _DEFAULT_STYLES.get(level)
+        if style is None:
+            raise NotifyValueError("invalid_level", level, _ALLOWED_LEVELS_STR)
+
+        color, prompt, _scope, prompt_prefix, prompt_suffix = style
+        run_codes: ColorCodes = get_color_codes(color)
+        if run_codes == codes:
+            parts.append('\n')
+        else:
+            if codes is not None:
+                parts += (codes.reset, '\n')
+            parts.append(run_codes.color)
+            codes = run_codes
+        parts.append(f"{prompt_prefix}{prompt}{prompt_suffix} {message}")
+
+    if codes is not None:
+        parts.append(codes.reset)
+
+    return ''.join(parts)
+
+
+# The docstring shared by the generated bytes functions, filled in with each level's wording.
+_BYTES_DOCSTRING: str = """
+    Format {article} {name} message with its default style as UTF-8 bytes.
+
+    Callers writing many messages to a binary stream (for example sys.stdout.buffer) can use this to skip the
+    text layer, and the encoding of the constant prompt, on every write.
+
+    Arguments:
+        message (str): The {name} message to be printed. Any other object, such as an exception, is converted with str().
+
+    Returns:
+        bytes: The formatted {name} message encoded as UTF-8, followed by a newline.
     """
-    return format_message(message, prompt, color, scope, prompt_prefix, prompt_suffix)
+
+
+def _make_bytes_function(level: str, article: str, name: str) -> Callable[[str], bytes]:
+    """
+    Build the bytes variant of a level's message function, with that level's encoded default style bound into it.
+
+    The style comes from make_style, like the default style of the message functions, so both always
+    produce the same text; only the message itself is encoded on each call.
+
+    Arguments:
+        level (str): The message level, a key of _DEFAULT_STYLES.
+        article (str): The article used in the docstring ('a' or 'an').
+        name (str): The name of the message in the docstring (e.g. 'success').
+
+    Returns:
+        Callable[[str], bytes]: The bytes function.
+    """
+    default_style: Style = make_style(*_DEFAULT_STYLES[level])
+    prefix_bytes: bytes = default_style.prefix.encode('utf-8')
+    suffix_bytes: bytes = default_style.suffix.encode('utf-8') + b'\n'
+
+    def bytes_function(message: str) -> bytes:
+        return prefix_bytes + str(message).encode('utf-8') + suffix_bytes
+
+    bytes_function.__name__ = bytes_function.__qualname__ = f"{level}_bytes"
+    bytes_function.__doc__ = _BYTES_DOCSTRING.format(article=article, name=name)
+    return bytes_function
+
+
+# Bytes variants of the message functions, using each level's default style.
+success_bytes: Callable[[str], bytes] = _make_bytes_function('success', 'a', 'success')
+warning_bytes: Callable[[str], bytes] = _make_bytes_function('warning', 'a', 'warning')
+error_bytes: Callable[[str], bytes] = _make_bytes_function('error', 'an', 'error')
+failure_bytes: Callable[[str], bytes] = _make_bytes_function('failure', 'a', 'failure')
+info_bytes: Callable[[str], bytes] = _make_bytes_function('info', 'an', 'informational')
+system_bytes: Callable[[str], bytes] = _make_bytes_function('system', 'a', 'system')
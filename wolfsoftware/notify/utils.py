@@ -1,10 +1,12 @@
 """
 This module provides utilities for working with color-coded messages in the terminal.
 
-It uses ANSI color codes and the colorama library for cross-platform support.
+It uses standard ANSI SGR escape codes written out as literals, so this module does not need colorama; the package only
+imports colorama on Windows, to enable virtual terminal processing on the console.
 
 The primary function in this module is:
-- `get_color_codes`: Returns a dictionary with ANSI color codes based on the specified color parameter.
+- `get_color_codes`: Returns a ColorCodes named tuple with ANSI color codes based on the specified color parameter.
+- `get_color_codes_dict`: Returns the same codes as a dictionary, for callers of the earlier dictionary-returning API.
 
 Returns:
 --------
@@ -23,24 +25,124 @@ To use the color code utility function, you can import it and get the required c
     from your_module_name import get_color_codes
 
     color_codes = get_color_codes('red+bold')
-    print(f"{color_codes['color']}This is a bold red message{color_codes['reset']}")
+    print(f"{color_codes.color}This is a bold red message{color_codes.reset}")
 
 """
 # pylint: disable=relative-beyond-top-level
 
-import re
-import colorama
+import sys
+
+from functools import lru_cache
+from typing import Final, NamedTuple, NoReturn, Optional
 
 from .exceptions import NotifyValueError
 
 
-def get_color_codes(color: str = '') -> dict:
+# Color and style names mapped to their ANSI codes, built once at import rather than on every call. These are
+# the same sequences colorama's Fore and Style constants hold; colorama is only imported on Windows, to enable virtual
+# terminal processing on the console, so reading the codes from it only added its import to every consumer's startup.
+# The names are identifier-like literals, which the compiler already interns; the escape sequences are not, so intern them here.
+_COLOR_CODES: Final[dict[str, str]] = {
+    'black': sys.intern('\x1b[30m'),
+    'blue': sys.intern('\x1b[34m'),
+    'cyan': sys.intern('\x1b[36m'),
+    'green': sys.intern('\x1b[32m'),
+    'grey': sys.intern('\x1b[90m'),
+    'magenta': sys.intern('\x1b[35m'),
+    'red': sys.intern('\x1b[31m'),
+    'white': sys.intern('\x1b[37m'),
+    'yellow': sys.intern('\x1b[33m'),
+    'bold': sys.intern('\x1b[1m'),
+    'reset': sys.intern('\x1b[0m')
+}
+
+# The code that resets all formatting, closing every colored span.
+_RESET: Final[str] = _COLOR_CODES['reset']
+
+# The allowed color component names, joined once for the invalid component error message.
+_ALLOWED_COLORS_STR: Final[str] = ', '.join(_COLOR_CODES.keys())
+
+
+class ColorCodes(NamedTuple):
+    """
+    The ANSI codes for a color specification.
+
+    Attributes:
+    -----------
+    color (str): The ANSI code(s) for the specified color and style.
+    reset (str): The ANSI code to reset the text formatting, or '' if no color was specified.
+    """
+
+    color: str
+    reset: str
+
+
+def _build_full_map() -> dict[str, ColorCodes]:
+    """
+    Build the codes for every valid color specification.
+
+    A valid specification is a single color or style name, or two names joined by '+' where at least one of them is 'bold'.
+
+    Returns:
+    --------
+    dict[str, ColorCodes]: Each valid specification mapped to its ColorCodes.
+    """
+    full_map: dict[str, ColorCodes] = {}
+
+    for first, first_code in _COLOR_CODES.items():
+        full_map[first] = ColorCodes(first_code, _RESET)
+        for second, second_code in _COLOR_CODES.items():
+            if 'bold' in (first, second):
+                full_map[f"{first}+{second}"] = ColorCodes(first_code + second_code, _RESET)
+
+    return full_map
+
+
+# The set of color specifications is small and closed, so every valid one (including every message function default)
+# is resolved once at import, and get_color_codes is a single dict lookup rather than a split, a loop and a concatenation.
+_FULL_MAP: Final[dict[str, ColorCodes]] = _build_full_map()
+
+# Deletes every ASCII character that is not allowed in a color specification (anything but letters and '+').
+# str.translate does this in a single C loop, which is cheaper than a regex substitution on such short strings.
+_COLOR_SANITIZE_TABLE: Final[dict[int, Optional[int]]] = str.maketrans('', '', ''.join(
+    character for character in map(chr, range(128)) if not (character.isalpha() or character == '+')
+))
+
+# The codes returned when no color is specified.
+_NO_COLOR: Final[ColorCodes] = ColorCodes('', '')
+
+
+def _raise_invalid_color(sanitized_color: str) -> NoReturn:
+    """
+    Raise the error describing why a sanitized color specification is invalid.
+
+    Arguments:
+    ----------
+    sanitized_color (str): A sanitized color specification that is not in _FULL_MAP.
+
+    Raises:
+    -------
+    NotifyValueError: If the specification has more than two parts, or two parts without 'bold'.
+    NotifyValueError: If the specification contains an unknown color component.
+    """
+    head, separator, tail = sanitized_color.partition('+')
+    if separator and ('+' in tail or 'bold' not in (head, tail)):
+        raise NotifyValueError("invalid_format")
+
+    invalid_part: str = head if head not in _COLOR_CODES else tail
+    raise NotifyValueError("invalid_component", invalid_part, _ALLOWED_COLORS_STR)
+
+
+def get_color_codes(color: str = '') -> ColorCodes:
     """
     Generate ANSI color codes for terminal message formatting.
 
-    This function returns a dictionary containing ANSI color codes based on the specified color
-    parameter. It supports various colors and styles, including bold text. The colorama library
-    is used to ensure compatibility across different platforms.
+    This function returns a ColorCodes named tuple containing ANSI color codes based on the specified color
+    parameter. It supports various colors and styles, including bold text.
+
+    An empty color, and every valid specification spelled exactly as it is documented (all of the message
+    function defaults among them), is answered from tables built at import without touching a cache. Anything
+    else is sanitized and resolved through a cache. The returned named tuple is immutable, so a cached value can be shared safely between callers.
 
     Arguments:
     ----------
@@ -49,7 +151,7 @@ def get_color_codes(color: str = '') -> dict:
 
     Returns:
     --------
-    dict: A dictionary with keys 'color' and 'reset', containing the respective ANSI codes.
+    ColorCodes: A named tuple with fields 'color' and 'reset', containing the respective ANSI codes.
           - 'color': The ANSI code(s) for the specified color and style.
           - 'reset': The ANSI code to reset the text formatting.
 
@@ -64,40 +166,70 @@ def get_color_codes(color: str = '') -> dict:
     To use the color code utility function, you can get the required color codes as follows:
 
         color_codes = get_color_codes('red+bold')
-        print(f"{color_codes['color']}This is a bold red message{color_codes['reset']}")
+        print(f"{color_codes.color}This is a bold red message{color_codes.reset}")
+    """
+    if not color:
+        return _NO_COLOR
+
+    codes: Optional[ColorCodes] = _FULL_MAP.get(color)
+    if codes is None:
+        codes = _compute_codes(color)
+
+    return codes
+
+
+@lru_cache(maxsize=64)
+def _compute_codes(color: str) -> ColorCodes:
+    """
+    Resolve a color specification that is not already spelled exactly as a _FULL_MAP key.
+
+    This is the slow path for specifications with stray characters or unusual case, such as 'Green + Bold'.
+    Results are cached, so a caller that repeats the same spelling only pays for sanitizing it once. The cache
+    is bounded, so callers passing many distinct (for example user-supplied) strings cannot grow it without limit.
+
+    Arguments:
+    ----------
+    color (str): The color and style to apply.
+
+    Returns:
+    --------
+    ColorCodes: The ANSI codes for the specification.
+
+    Raises:
+    -------
+    NotifyValueError: If an invalid color component or color format is provided.
+    """
+    sanitized_color: str = color.translate(_COLOR_SANITIZE_TABLE)  # Remove everything except alphabetic characters and '+'
+    if not sanitized_color.isascii():
+        sanitized_color = ''.join(character for character in sanitized_color if character.isascii())
+    if not sanitized_color.islower():  # Only allocate a lowercased copy when there is an uppercase letter to fold
+        sanitized_color = sanitized_color.lower()
+
+    codes: Optional[ColorCodes] = _FULL_MAP.get(sanitized_color)
+    if codes is None:
+        _raise_invalid_color(sanitized_color)
+
+    return codes
+
+
+def get_color_codes_dict(color: str = '') -> dict[str, str]:
+    """
+    Generate ANSI color codes as a dictionary.
+
+    This is a compatibility shim for callers written against the earlier dictionary-returning
+    get_color_codes. New code should use get_color_codes and unpack the returned ColorCodes.
+
+    Arguments:
+    ----------
+    color (str, optional): The color and style to apply. It can be a color, 'color+bold', or 'bold'.
+                           Default is '' (no color).
+
+    Returns:
+    --------
+    dict: A dictionary with keys 'color' and 'reset', containing the respective ANSI codes.
+
+    Raises:
+    -------
+    NotifyValueError: If an invalid color component or color format is provided.
     """
-    colors: dict[str, str] = {
-        'black': colorama.Fore.BLACK,
-        'blue': colorama.Fore.BLUE,
-        'cyan': colorama.Fore.CYAN,
-        'green': colorama.Fore.GREEN,
-        'grey': colorama.Fore.LIGHTBLACK_EX,
-        'magenta': colorama.Fore.MAGENTA,
-        'red': colorama.Fore.RED,
-        'white': colorama.Fore.WHITE,
-        'yellow': colorama.Fore.YELLOW,
-        'bold': colorama.Style.BRIGHT,
-        'reset': colorama.Style.RESET_ALL
-    }
-
-    # Set color and style if specified
-    color_code: str = ''
-    if color:
-        sanitized_color: str = re.sub(r'[^a-zA-Z+]', '', color).lower()  # Remove everything except alphabetic characters and '+', and convert to lowercase
-        parts: list[str] = sanitized_color.split('+')
-        if len(parts) > 2 or (len(parts) == 2 and 'bold' not in parts):
-            raise NotifyValueError("Invalid color format. Use 'color', 'color+bold', or 'bold'.")
-
-        color_code = ''
-        for part in parts:
-            if part in colors:
-                color_code += colors[part]
-            else:
-                raise NotifyValueError(f"Invalid color component '{part}'. Allowed values are: {', '.join(colors.keys())}")
-
-    reset_code: str = colors['reset'] if color_code else ''
-
-    return {
-        "color": color_code,
-        "reset": reset_code
-    }
+    return get_color_codes(color)._asdict()